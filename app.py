@@ -1,12 +1,21 @@
 # app.py
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 from sqlalchemy import text
+from starlette.formparsers import MultiPartParser
 from core.config import settings
+from core.limits import BodySizeLimitMiddleware
 from db.session import Base, engine
 from routers import auth, resume, health, auth_reset
-from routers import analyze as analyze_router, rewrite as rewrite_router
+from routers import analyze as analyze_router, rewrite as rewrite_router, history as history_router
+from services.ai import close_clients as close_ai_clients
+from services.analysis_store import analysis_buffer
+from services.bulk import shutdown_pool as shutdown_bulk_pool
+from services import warmup
+from services.keywords import keyword_buffer
 
 # --- DB bootstrap -------------------------------------------------------------
 Base.metadata.create_all(bind=engine)
@@ -32,16 +41,42 @@ with engine.begin() as conn:
         conn.execute(text("ALTER TABLE analyses ADD COLUMN IF NOT EXISTS analysis_type VARCHAR DEFAULT 'ats'"))
     except Exception as e:
         print(f"[analyses.*] note: {e}")
+    try:
+        conn.execute(text("ALTER TABLE analyses ADD COLUMN IF NOT EXISTS jd_hash VARCHAR"))
+    except Exception as e:
+        print(f"[analyses.jd_hash] note: {e}")
+    try:
+        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_analyses_owner_created ON analyses (owner_id, created_at)"))
+    except Exception as e:
+        print(f"[analyses.ix_owner_created] note: {e}")
 
 # --- App ----------------------------------------------------------------------
+# orjson is several times faster on the large nested ATS payloads; optional
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+except ImportError:
+    DefaultResponse = JSONResponse
+
 app = FastAPI(
     title="CV Optimizer API",
     version="1.0.0",
     description="AI-powered CV optimization and ATS scoring API",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=DefaultResponse,
 )
 
+# Upload memory bounds: refuse oversized bodies up front (413) and keep at most
+# UPLOAD_SPOOL_MEMORY_BYTES of each uploaded file in RAM, the rest on disk.
+# Added before CORS so CORS wraps it and the browser can read the 413.
+app.add_middleware(
+    BodySizeLimitMiddleware,
+    max_bytes=settings.MAX_REQUEST_BYTES,
+    path_limits={"/api/analyze/bulk": settings.BULK_MAX_REQUEST_BYTES},
+)
+MultiPartParser.spool_max_size = settings.UPLOAD_SPOOL_MEMORY_BYTES
+
 # CORS
 origins = [o.strip() for o in settings.CORS_ALLOW_ORIGINS.split(",") if o.strip()]
 app.add_middleware(
@@ -50,8 +85,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],
 )
 
+# Compress large JSON bodies (ATS payloads, previews); small ones aren't worth it
+app.add_middleware(GZipMiddleware, minimum_size=settings.GZIP_MIN_BYTES)
+
 # Routers (no extra prefixes; they already have them)
 app.include_router(health.router)          # /health
 app.include_router(auth.router)            # /auth/*
@@ -61,6 +100,7 @@ app.include_router(resume.router)          # /resumes/*
 # /api namespace for analyze & rewrite
 app.include_router(analyze_router.router, prefix="/api")   # /api/analyze/*
 app.include_router(rewrite_router.router, prefix="/api")   # /api/rewrite/*
+app.include_router(history_router.router, prefix="/api")   # /api/analyses/*
 
 # Legacy alias: also accept /resume/upload (singular)
 from routers.resume import upload_resume as _resume_upload
@@ -77,6 +117,12 @@ async def startup_event():
     except Exception:
         pass
     print(f"🤖 AI Provider: {settings.AI_PROVIDER}")
+    analysis_buffer.start()
+    keyword_buffer.start()
+    # checks that already passed pre-fork (gunicorn preload) are skipped here
+    checks = await run_in_threadpool(warmup.run)
+    failed = [name for name, res in checks.items() if not res["ok"]]
+    print(f"🔥 Warm-up: {len(checks) - len(failed)}/{len(checks)} checks passed" + (f", failed: {failed}" if failed else ""))
 
 @app.get("/", include_in_schema=False)
 async def root():
@@ -85,6 +131,10 @@ async def root():
 @app.on_event("shutdown")
 async def shutdown_event():
     print("👋 CV Optimizer API shutting down…")
+    analysis_buffer.stop()
+    keyword_buffer.stop()
+    shutdown_bulk_pool()
+    await close_ai_clients()
 
 @app.exception_handler(500)
 async def internal_exception_handler(request, exc):
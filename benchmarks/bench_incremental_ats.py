@@ -0,0 +1,114 @@
+# backend/benchmarks/bench_incremental_ats.py
+"""Full vs incremental ats_score for a typical one-bullet edit, and for a cold cache.
+
+Also checks that both modes find exactly the phrases the original scorer
+(fuzzy_find_present over the whole CV) finds. The check covers every edited
+CV, the fixture CV and the sample CVs in uploads/. It times that baseline too.
+
+Cold timings match each sample CV incrementally with an empty window cache.
+That is what a first submission costs, or one that lands on another worker.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_incremental_ats --repeat 50
+"""
+import argparse
+import os
+import sys
+import time
+
+def _baseline_present(cv_text: str):
+    from services.ats import CATEGORIES, fuzzy_find_present
+    return {cat: fuzzy_find_present(cv_text, bank) for cat, bank in CATEGORIES.items()}
+
+def _check_against_baseline(cv_text: str, label: str) -> None:
+    from services.ats import find_cv_present
+    expected = _baseline_present(cv_text)
+    for incremental in (False, True):
+        got = find_cv_present(cv_text, incremental=incremental)
+        assert got == expected, f"{label}: incremental={incremental} differs from the baseline scorer"
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--repeat", type=int, default=50)
+    ap.add_argument("--bullets", type=int, default=40, help="experience bullets in the synthetic CV")
+    args = ap.parse_args()
+
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from loadtest.fixtures import CV_LINES, JOB_DESCRIPTION, cv_text
+    from services import parser
+    from services import ats
+    from services.ats import ats_score, find_cv_present
+
+    samples = {"fixture CV": cv_text()}
+    uploads = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "uploads")
+    for name in sorted(os.listdir(uploads)) if os.path.isdir(uploads) else []:
+        text = parser.extract_text(os.path.join(uploads, name))
+        if text:
+            samples[name] = text
+    for label, text in samples.items():
+        _check_against_baseline(text, label)
+
+    cold = {}
+    for label, text in samples.items():
+        expected = _baseline_present(text)
+        full_s = cold_s = 0.0
+        for _ in range(args.repeat):
+            t0 = time.perf_counter()
+            find_cv_present(text)
+            full_s += time.perf_counter() - t0
+            ats._segment_cache.clear()
+            t0 = time.perf_counter()
+            got = find_cv_present(text, incremental=True)
+            cold_s += time.perf_counter() - t0
+            assert got == expected, f"{label}: cold incremental differs from the baseline scorer"
+        # windows filled by a cold pass must serve the next (warm) pass exactly
+        t0 = time.perf_counter()
+        got = find_cv_present(text, incremental=True)
+        warm_ms = (time.perf_counter() - t0) * 1000
+        assert got == expected, f"{label}: warm pass after a cold one differs from the baseline scorer"
+        cold[label] = (full_s / args.repeat * 1000, cold_s / args.repeat * 1000, warm_ms)
+
+    extra = [f"- Delivered project {i} with Python, SQL and stakeholder management; reduced costs by {i % 40}%."
+             for i in range(args.bullets)]
+    base_lines = CV_LINES[:4] + extra + CV_LINES[4:]
+
+    def edited(n: int) -> str:
+        # rewrite one bullet, as a user does between two submissions
+        lines = list(base_lines)
+        lines[4 + n % args.bullets] = f"- Led migration {n} to Kubernetes and Terraform, saving {n % 50}% on infra."
+        return "\n".join(lines)
+
+    ats_score("\n".join(base_lines), JOB_DESCRIPTION, incremental=True)  # the version before the edits
+
+    full = incr = base = match = 0.0
+    for n in range(args.repeat):
+        cv = edited(n)
+        _check_against_baseline(cv, f"edit {n}")
+        t0 = time.perf_counter()
+        _baseline_present(cv)
+        base += time.perf_counter() - t0
+        t0 = time.perf_counter()
+        find_cv_present(cv)
+        match += time.perf_counter() - t0
+        t0 = time.perf_counter()
+        expected = ats_score(cv, JOB_DESCRIPTION)
+        full += time.perf_counter() - t0
+
+        # reset to the pre-edit CV so each edit really is a single-bullet change
+        ats_score("\n".join(base_lines), JOB_DESCRIPTION, incremental=True)
+        t0 = time.perf_counter()
+        got = ats_score(cv, JOB_DESCRIPTION, incremental=True)
+        incr += time.perf_counter() - t0
+        assert got == expected, f"incremental result differs from full recompute at edit {n}"
+
+    print(f"CV lines={len(base_lines)} chars={len(edited(0))} edits={args.repeat}")
+    print(f"matches baseline scorer on {len(samples)} sample CV(s) and every edit")
+    print(f"CV matching    : baseline {base / args.repeat * 1000:.2f} ms, full {match / args.repeat * 1000:.2f} ms")
+    print(f"full recompute : {full / args.repeat * 1000:8.2f} ms/score")
+    print(f"incremental    : {incr / args.repeat * 1000:8.2f} ms/score  ({full / incr:.1f}x faster)")
+    for label, (full_ms, cold_ms, warm_ms) in cold.items():
+        print(f"CV matching, cold cache: {cold_ms:.2f} ms vs full {full_ms:.2f} ms, "
+              f"then {warm_ms:.2f} ms warm  ({label})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# backend/benchmarks/bench_keywords.py
+"""Corpus keyword statistics on a synthetic corpus (default 10k CVs/JDs).
+
+Reports observe throughput, TF-IDF ranking latency, vocabulary size and the
+cost of writing the batched document-frequency deltas to SQLite.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_keywords --docs 10000 --batch 100
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+def _corpus(n: int, seed: int = 7):
+    from loadtest.fixtures import CV_LINES, JOB_DESCRIPTION
+    from services.ats import ALL
+
+    rng = random.Random(seed)
+    banks = sorted(ALL)
+    verbs = ["Built", "Led", "Designed", "Migrated", "Owned", "Automated", "Scaled", "Shipped"]
+    nouns = ["platform", "pipeline", "service", "dashboard", "data model", "API", "team", "roadmap"]
+    base = CV_LINES + JOB_DESCRIPTION.splitlines()
+    # long tail of domain words (Zipf-like), so the vocabulary grows the way a real one does
+    syllables = ["ka", "ro", "ti", "mel", "van", "so", "dex", "lu", "pra", "zen", "or", "ba"]
+    vocab = ["".join(rng.choices(syllables, k=3)) for _ in range(20000)]
+    weights = [1 / (r + 1) for r in range(len(vocab))]
+    docs = []
+    for i in range(n):
+        lines = rng.sample(base, 8)
+        for _ in range(rng.randint(10, 30)):
+            skills = ", ".join(rng.sample(banks, 3))
+            domain = " ".join(rng.choices(vocab, weights, k=2))
+            lines.append(f"- {rng.choice(verbs)} a {domain} {rng.choice(nouns)} with {skills}; "
+                         f"client {rng.randint(1, 500)}.")
+        docs.append("\n".join(lines))
+    return docs
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--docs", type=int, default=10000)
+    ap.add_argument("--batch", type=int, default=100, help="documents per observe_many call")
+    ap.add_argument("--rank", type=int, default=1000, help="documents to rank after the corpus is built")
+    args = ap.parse_args()
+
+    tmp = tempfile.mkdtemp(prefix="bench-keywords-")
+    os.environ["DATABASE_URL"] = f"sqlite:///{tmp}/bench.db"
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from core.config import settings
+    from db.models import KeywordStat
+    from db.session import Base, SessionLocal, engine
+    from services.keywords import CorpusStats, KeywordStatsBuffer, terms
+
+    Base.metadata.create_all(bind=engine, tables=[KeywordStat.__table__])
+    docs = _corpus(args.docs)
+    print(f"corpus: {len(docs)} documents, {sum(map(len, docs)) / 1e6:.1f} MB of text")
+
+    # the buffer is flushed by hand below, so the DB write is timed on its own
+    buffer = KeywordStatsBuffer(KeywordStat, flush_ms=10**9, max_rows=10**9)
+    buffer._thread = object()  # keep enqueue from starting the background thread
+    stats = CorpusStats(settings.KEYWORD_VOCAB_MAX, buffer=buffer)
+
+    t0 = time.perf_counter()
+    for i in range(0, len(docs), args.batch):
+        stats.observe_many(docs[i:i + args.batch])
+    observe_s = time.perf_counter() - t0
+    print(f"observe: {observe_s:.2f}s ({len(docs) / observe_s:.0f} docs/s), "
+          f"{len(stats)} terms, df array {stats._df.itemsize * len(stats._df) / 1024:.0f} KB")
+
+    t0 = time.perf_counter()
+    written = buffer.flush()
+    flush_s = time.perf_counter() - t0
+    db = SessionLocal()
+    rows = db.query(KeywordStat).count()
+    db.close()
+    print(f"flush: {written} documents -> {rows} keyword_stats rows in {flush_s:.2f}s")
+
+    t0 = time.perf_counter()
+    fresh = CorpusStats(settings.KEYWORD_VOCAB_MAX)
+    fresh.load()
+    print(f"load: {len(fresh)} terms, {fresh.n_docs} documents in {time.perf_counter() - t0:.2f}s")
+
+    lat = []
+    for doc in docs[:args.rank]:
+        t = time.perf_counter()
+        stats.top(doc, 20)
+        lat.append((time.perf_counter() - t) * 1000)
+    lat.sort()
+    tok = []
+    for doc in docs[:args.rank]:
+        t = time.perf_counter()
+        terms(doc)
+        tok.append((time.perf_counter() - t) * 1000)
+    print(f"top(k=20): p50 {statistics.median(lat):.2f} ms, p95 {lat[int(len(lat) * 0.95)]:.2f} ms "
+          f"(of which tokenizing p50 {statistics.median(tok):.2f} ms)")
+    print("example:", stats.top(docs[0], 8))
+
+if __name__ == "__main__":
+    main()
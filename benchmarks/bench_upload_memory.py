@@ -0,0 +1,109 @@
+# backend/benchmarks/bench_upload_memory.py
+"""Peak server RSS under concurrent large uploads (Linux only: reads /proc).
+
+Boots one uvicorn worker, fires --concurrency uploads of --size-mb each at
+/resumes/upload, then reports the worker's peak RSS (VmHWM) against the total
+bytes uploaded. It fails unless every upload succeeded, RSS grew by at most
+UPLOAD_SPOOL_MEMORY_BYTES per concurrent upload plus --slack-mb, and an
+over-limit body was refused with 413.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_upload_memory --size-mb 50 --concurrency 8
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from core.config import settings  # noqa: E402
+from loadtest.fixtures import pdf_bytes  # noqa: E402
+from loadtest.run import _free_port, _wait_healthy  # noqa: E402
+
+def _proc_kb(pid: int, field: str) -> int:
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            if line.startswith(field + ":"):
+                return int(line.split()[1])
+    raise KeyError(field)
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--size-mb", type=int, default=50)
+    ap.add_argument("--concurrency", type=int, default=8)
+    ap.add_argument("--rounds", type=int, default=2)
+    ap.add_argument("--slack-mb", type=int, default=64,
+                    help="RSS growth allowed on top of one spool buffer per concurrent upload")
+    args = ap.parse_args()
+
+    size = args.size_mb * 1024 * 1024
+    tmp = tempfile.mkdtemp(prefix="bench-upload-")
+    port = _free_port()
+    env = dict(os.environ,
+               DATABASE_URL=f"sqlite:///{tmp}/bench.db",
+               UPLOAD_MAX_BYTES=str(size + 1024 * 1024),
+               MAX_REQUEST_BYTES=str(size + 2 * 1024 * 1024),
+               UPLOAD_SPOOL_MEMORY_BYTES=str(settings.UPLOAD_SPOOL_MEMORY_BYTES))
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app:app", "--port", str(port), "--log-level", "warning"],
+        cwd=BACKEND_DIR, env=env,
+    )
+    base = f"http://127.0.0.1:{port}"
+    try:
+        _wait_healthy(base, proc)
+        token = requests.post(base + "/auth/register",
+                              json={"email": "bench@example.com", "password": "bench-pw"}).json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+
+        small = pdf_bytes()
+        requests.post(base + "/resumes/upload", headers=headers,
+                      files={"file": ("cv.pdf", small, "application/pdf")}).raise_for_status()
+        baseline_kb = _proc_kb(proc.pid, "VmHWM")
+
+        big = pdf_bytes(padding=size - len(small))
+
+        def upload(_):
+            r = requests.post(base + "/resumes/upload", headers=headers,
+                              files={"file": ("cv.pdf", big, "application/pdf")})
+            return r.status_code
+
+        t0 = time.perf_counter()
+        codes = []
+        with ThreadPoolExecutor(args.concurrency) as pool:
+            for _ in range(args.rounds):
+                codes += list(pool.map(upload, range(args.concurrency)))
+        elapsed = time.perf_counter() - t0
+        peak_kb = _proc_kb(proc.pid, "VmHWM")
+
+        too_big = pdf_bytes(padding=size + 4 * 1024 * 1024)
+        t1 = time.perf_counter()
+        r = requests.post(base + "/resumes/upload", headers=headers,
+                          files={"file": ("cv.pdf", too_big, "application/pdf")})
+        reject_ms = (time.perf_counter() - t1) * 1000
+
+        uploaded_mb = args.size_mb * args.concurrency * args.rounds
+        print(f"uploads: {len(codes)} x {args.size_mb} MB, {args.concurrency} concurrent, statuses={sorted(set(codes))}")
+        print(f"elapsed: {elapsed:.1f}s ({uploaded_mb / elapsed:.0f} MB/s)")
+        print(f"peak RSS: {baseline_kb / 1024:.0f} MB before -> {peak_kb / 1024:.0f} MB after "
+              f"(+{(peak_kb - baseline_kb) / 1024:.0f} MB for {args.size_mb * args.concurrency} MB in flight)")
+        print(f"over-limit upload: HTTP {r.status_code} in {reject_ms:.0f} ms")
+
+        growth = (peak_kb - baseline_kb) * 1024
+        bound = settings.UPLOAD_SPOOL_MEMORY_BYTES * args.concurrency + args.slack_mb * 1024 * 1024
+        assert set(codes) == {200}, f"uploads failed: statuses={sorted(set(codes))}"
+        assert growth <= bound, (f"RSS grew {growth / 2**20:.0f} MB, over the {bound / 2**20:.0f} MB bound: "
+                                 f"uploads are being buffered in memory")
+        assert r.status_code == 413, f"over-limit upload got HTTP {r.status_code}, expected 413"
+    finally:
+        proc.terminate()
+        proc.wait(timeout=30)
+
+if __name__ == "__main__":
+    main()
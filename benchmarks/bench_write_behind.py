@@ -0,0 +1,68 @@
+# backend/benchmarks/bench_write_behind.py
+"""Compare one-commit-per-analysis inserts with the write-behind buffer.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_write_behind --rows 5000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, default=5000)
+    ap.add_argument("--flush-rows", type=int, default=200)
+    ap.add_argument("--flush-ms", type=int, default=50)
+    args = ap.parse_args()
+
+    # point the app at a throwaway DB before anything imports db.session
+    tmp = tempfile.mkdtemp(prefix="bench-wb-")
+    os.environ["DATABASE_URL"] = f"sqlite:///{tmp}/bench.db"
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    from db.session import Base, engine, SessionLocal
+    from db.models import Analysis, User
+    from db.write_behind import WriteBehindBuffer
+
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        user = User(email="bench@example.com", password_hash="x")
+        db.add(user)
+        db.commit()
+        uid = user.id
+
+    def row(i: int) -> dict:
+        return {"owner_id": uid, "job_description": "jd", "jd_hash": "h",
+                "result_json": '{"ats": {}}', "score": i % 100, "analysis_type": "ats"}
+
+    # baseline: what a synchronous insert per request costs
+    t0 = time.perf_counter()
+    for i in range(args.rows):
+        with SessionLocal() as db:
+            db.add(Analysis(**row(i)))
+            db.commit()
+    sync_s = time.perf_counter() - t0
+
+    buf = WriteBehindBuffer(Analysis, flush_ms=args.flush_ms, max_rows=args.flush_rows)
+    buf.start()
+    t0 = time.perf_counter()
+    for i in range(args.rows):
+        buf.enqueue(row(i))
+    enqueue_s = time.perf_counter() - t0
+    buf.stop()
+    drained_s = time.perf_counter() - t0
+
+    with SessionLocal() as db:
+        total = db.query(Analysis).count()
+    assert total == 2 * args.rows, f"expected {2 * args.rows} rows, found {total}"
+
+    print(f"rows={args.rows}")
+    print(f"sync insert+commit : {sync_s:8.3f}s  {args.rows / sync_s:10.0f} rows/s")
+    print(f"write-behind total : {drained_s:8.3f}s  {args.rows / drained_s:10.0f} rows/s "
+          f"({buf.flushed_batches} batches)")
+    print(f"hot-path enqueue   : {enqueue_s * 1e6 / args.rows:8.2f}us per row")
+
+if __name__ == "__main__":
+    main()
@@ -18,6 +18,44 @@ class Settings(BaseSettings):
     AI_PROVIDER: str = "mock"  # "openai" or "mock"
     OPENAI_API_KEY: str | None = None
     OPENAI_MODEL: str = "gpt-4o-mini"
+    OPENAI_BASE_URL: str | None = None  # e.g. a local stub for load tests
+    AI_BUDGET_MS: int = 8000  # latency budget for an analyze request, AI call included
+    AI_MIN_BUDGET_MS: int = 1500  # below this remaining budget, skip the model and use heuristics
+    AI_SLOW_CALL_MS: int = 6000  # a successful call slower than this counts against the breaker
+    AI_BREAKER_FAILURES: int = 5  # consecutive failed/slow calls that open the circuit
+    AI_BREAKER_RESET_S: int = 30  # how long the circuit stays open before a probe call
+    
+    # Analysis history (write-behind buffer)
+    ANALYSIS_FLUSH_MS: int = 250  # flush at least this often…
+    ANALYSIS_FLUSH_ROWS: int = 100  # …or as soon as this many rows are pending
+    ANALYSIS_MAX_PENDING: int = 10000  # rows held while the DB is unreachable; oldest dropped beyond this
+    ANALYSIS_FLUSH_RETRIES: int = 5  # failed flush attempts (with backoff) before a batch is dropped
+    
+    # Keyword statistics (document frequencies over analyzed CVs/JDs)
+    KEYWORD_MAX_NGRAM: int = 3  # longest phrase counted as one term
+    KEYWORD_PHRASE_MIN_DF: int = 2  # documents a phrase must appear in before top() ranks it
+    KEYWORD_VOCAB_MAX: int = 200_000  # terms tracked per worker; new terms beyond this are ignored
+    KEYWORD_FLUSH_MS: int = 2000
+    KEYWORD_FLUSH_DOCS: int = 500
+    
+    # Uploads
+    UPLOAD_MAX_BYTES: int = 10 * 1024 * 1024  # one CV file
+    MAX_REQUEST_BYTES: int = 12 * 1024 * 1024  # whole request body (file + form fields)
+    UPLOAD_SPOOL_MEMORY_BYTES: int = 1024 * 1024  # uploads bigger than this spill to a temp file
+    
+    # Bulk scoring (/api/analyze/bulk)
+    BULK_MAX_REQUEST_BYTES: int = 250 * 1024 * 1024
+    BULK_MAX_FILES: int = 200
+    BULK_MAX_FILE_BYTES: int = 10 * 1024 * 1024  # per CV inside the batch
+    BULK_CONCURRENCY: int = 8  # CVs in flight per request
+    BULK_WORKERS: int = 2  # parse/score processes per API worker (0 = use threads)
+    
+    # Warm-up / readiness (/ready)
+    WARMUP_DB_CONNECTIONS: int = 2  # pool connections each worker opens before it reports ready
+    WARMUP_BULK_POOL: bool = False  # also spawn the bulk scoring processes (about 1s per process)
+    
+    # HTTP responses
+    GZIP_MIN_BYTES: int = 1024  # compress JSON bodies larger than this
     
     # Storage Configuration
     STORAGE_PROVIDER: str = "local"  # "local" or "s3"
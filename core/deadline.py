@@ -0,0 +1,12 @@
+# backend/core/deadline.py
+import time
+
+class Deadline:
+    """Latency budget for one request, started when the route begins work."""
+
+    def __init__(self, budget_ms: float):
+        self.expires_at = time.monotonic() + budget_ms / 1000.0
+
+    def remaining(self) -> float:
+        """Seconds left (never negative)."""
+        return max(0.0, self.expires_at - time.monotonic())
@@ -0,0 +1,35 @@
+# backend/core/etag.py
+import hashlib
+from typing import Optional
+
+from fastapi import Response
+
+def sha256_hex(data) -> str:
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.sha256(data or b"").hexdigest()
+
+def make_etag(*parts, weak: bool = False) -> str:
+    """ETag derived from the inputs that fully determine a response body.
+
+    Use ``weak`` when the body is semantically, but not byte-for-byte, stable.
+    """
+    digest = hashlib.sha256("\x1f".join(str(p) for p in parts).encode("utf-8")).hexdigest()
+    return f'W/"{digest[:32]}"' if weak else f'"{digest[:32]}"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """RFC 9110 If-None-Match check (weak comparison, so W/ prefixes are ignored)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    candidates = (c.strip() for c in if_none_match.split(","))
+    return any((c[2:] if c.startswith("W/") else c) == opaque for c in candidates)
+
+def cache_headers(etag: str) -> dict:
+    # private: responses are per-user; no-cache: always revalidate with the ETag
+    return {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers=cache_headers(etag))
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, Text, ForeignKey, DateTime, func
+from sqlalchemy import Column, Integer, String, Boolean, Text, ForeignKey, DateTime, Index, func
 from sqlalchemy.orm import relationship
 from db.session import Base
 
@@ -37,11 +37,21 @@ class Analysis(Base):
     result_json = Column(Text, nullable=False)
     score = Column(Integer, nullable=True)  # NEW: Overall match score (0-100)
     analysis_type = Column(String, default="ats", nullable=False)  # NEW: ats, skills, grammar, etc.
+    jd_hash = Column(String, nullable=True)  # NEW: sha256 of the JD, groups analyses per job
     created_at = Column(DateTime, server_default=func.now())
     
     resume = relationship("Resume", back_populates="analyses")
     owner = relationship("User", back_populates="analyses")
 
+    # history/trend queries always filter by owner and sort by time
+    __table_args__ = (Index("ix_analyses_owner_created", "owner_id", "created_at"),)
+
+class KeywordStat(Base):
+    """Document frequency of one keyword term across every analyzed CV and JD."""
+    __tablename__ = "keyword_stats"
+    term = Column(String, primary_key=True)  # the reserved term "<docs>" holds the document count
+    df = Column(Integer, nullable=False, default=0)
+
 # NEW: Subscription model for future payment features
 class Subscription(Base):
     __tablename__ = "subscriptions"
@@ -0,0 +1,205 @@
+# backend/db/write_behind.py
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from db.session import SessionLocal
+
+
+class WriteBehindBuffer:
+    """Collect rows in memory and insert them in batches from a background thread.
+
+    A flush happens every ``flush_ms`` milliseconds or as soon as ``max_rows``
+    rows are pending, whichever comes first. ``stop()`` drains what is left.
+
+    A failed batch goes back to the front of the queue and is retried with
+    exponential backoff, up to ``max_retries`` attempts, before it is dropped.
+    A batch rejected by a constraint is retried row by row instead, so only the
+    offending rows are dropped. The queue holds at most ``max_pending`` rows; beyond that the oldest rows
+    are dropped. Both kinds of loss count in ``failed_rows``.
+    """
+
+    def __init__(
+        self,
+        model,
+        flush_ms: int = 250,
+        max_rows: int = 100,
+        session_factory: Callable[[], Session] = SessionLocal,
+        max_pending: int = 10000,
+        max_retries: int = 5,
+        max_backoff_s: float = 30.0,
+    ):
+        self.model = model
+        self.flush_ms = max(1, int(flush_ms))
+        self.max_rows = max(1, int(max_rows))
+        self.session_factory = session_factory
+        self.max_pending = max(self.max_rows, int(max_pending))
+        self.max_retries = max(1, int(max_retries))
+        self.max_backoff_s = max_backoff_s
+
+        self._rows: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._failures = 0  # consecutive failed flushes
+        self._retry_at = 0.0  # monotonic time before which flushes wait (backoff)
+
+        # counters, handy for monitoring and benchmarks
+        self.flushed_rows = 0
+        self.flushed_batches = 0
+        self.failed_rows = 0
+        self.last_error: Optional[str] = None
+
+    # --- lifecycle -----------------------------------------------------------
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._run, name=f"write-behind:{self.model.__tablename__}", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stopping.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+        self.flush(force=True)
+
+    # --- API -----------------------------------------------------------------
+    def enqueue(self, row: Dict[str, Any]) -> None:
+        with self._lock:
+            self._rows.append(row)
+            self._trim()
+            full = len(self._rows) >= self.max_rows
+        if self._thread is None:
+            self.start()
+        if full:
+            self._wake.set()
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._rows)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            pending = len(self._rows)
+        return {
+            "pending": pending,
+            "flushed_rows": self.flushed_rows,
+            "flushed_batches": self.flushed_batches,
+            "failed_rows": self.failed_rows,
+            "consecutive_failures": self._failures,
+            "last_error": self.last_error,
+        }
+
+    def flush(self, force: bool = False) -> int:
+        """Insert everything pending in one statement; returns the number of rows written.
+
+        While backing off after a failure this is a no-op unless ``force`` is set.
+        """
+        with self._flush_lock:
+            if not force and time.monotonic() < self._retry_at:
+                return 0
+            with self._lock:
+                rows, self._rows = self._rows, []
+            if not rows:
+                return 0
+            db = self.session_factory()
+            rejected = False
+            try:
+                self._write(db, rows)
+                db.commit()
+            except IntegrityError:
+                # a bad row (e.g. a dangling foreign key) fails the whole statement
+                db.rollback()
+                rejected = True
+            except Exception as e:
+                db.rollback()
+                self._failed(rows, e)
+                return 0
+            finally:
+                db.close()
+            if rejected:
+                return self._write_each(rows)
+            self._failures = 0
+            self._retry_at = 0.0
+            self.flushed_rows += len(rows)
+            self.flushed_batches += 1
+            return len(rows)
+
+    def _write_each(self, rows: List[Dict[str, Any]]) -> int:
+        """Write rows one per transaction, dropping those that violate a constraint; caller holds the flush lock."""
+        name = self.model.__tablename__
+        written = 0
+        for i, row in enumerate(rows):
+            db = self.session_factory()
+            try:
+                self._write(db, [row])
+                db.commit()
+                written += 1
+            except IntegrityError as e:
+                db.rollback()
+                self.failed_rows += 1
+                self.last_error = str(e).splitlines()[0]
+                print(f"[write-behind:{name}] dropped a row rejected by the database: {self.last_error}")
+            except Exception as e:
+                # not the row's fault (connection lost, …): the rest goes through the usual retry
+                db.rollback()
+                self._failed(rows[i:], e)
+                break
+            finally:
+                db.close()
+        else:
+            self._failures = 0
+            self._retry_at = 0.0
+        self.flushed_rows += written
+        self.flushed_batches += 1 if written else 0
+        return written
+
+    def _write(self, db: Session, rows: List[Dict[str, Any]]) -> None:
+        """Persist one batch; subclasses override this to aggregate or upsert."""
+        db.execute(insert(self.model), rows)
+
+    def _failed(self, rows: List[Dict[str, Any]], error: Exception) -> None:
+        name = self.model.__tablename__
+        self._failures += 1
+        self.last_error = str(error).splitlines()[0] if str(error) else error.__class__.__name__
+        if self._failures >= self.max_retries or self._stopping.is_set():
+            self.failed_rows += len(rows)
+            self._failures = 0
+            self._retry_at = 0.0
+            print(f"[write-behind:{name}] dropped {len(rows)} rows after repeated failures: {self.last_error}")
+            return
+        # 2, 4, 8, 16s…: rides out a DB restart or a deploy-time lock before giving up
+        backoff = min(self.max_backoff_s, max(1.0, self.flush_ms / 1000.0) * 2 ** self._failures)
+        self._retry_at = time.monotonic() + backoff
+        with self._lock:
+            # oldest first, so history order survives the retry
+            self._rows = rows + self._rows
+            self._trim()
+        print(f"[write-behind:{name}] flush of {len(rows)} rows failed "
+              f"(attempt {self._failures}/{self.max_retries}), retrying in {backoff:.1f}s: {self.last_error}")
+
+    def _trim(self) -> None:
+        # caller holds self._lock
+        over = len(self._rows) - self.max_pending
+        if over > 0:
+            del self._rows[:over]
+            self.failed_rows += over
+
+    # --- worker --------------------------------------------------------------
+    def _run(self) -> None:
+        interval = self.flush_ms / 1000.0
+        while not self._stopping.is_set():
+            self._wake.wait(interval)
+            self._wake.clear()
+            self.flush()
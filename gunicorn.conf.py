@@ -0,0 +1,31 @@
+# backend/gunicorn.conf.py
+"""gunicorn settings for the API: ``gunicorn -c gunicorn.conf.py app:app``.
+
+With PRELOAD_APP on (the default), the master imports the app and runs the
+CPU-side warm-up once before forking. Workers then share the parsed modules,
+matcher caches and keyword statistics copy-on-write, instead of each building
+them on its first request.
+"""
+import os
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+workers = int(os.getenv("WEB_CONCURRENCY", "2"))
+worker_class = "uvicorn.workers.UvicornWorker"
+timeout = 120
+preload_app = os.getenv("PRELOAD_APP", "1").lower() in ("1", "true", "yes")
+
+def when_ready(server):
+    # runs in the master after the app is loaded, just before the first fork
+    if not preload_app:
+        return
+    from services import warmup
+
+    for name, res in warmup.run(warmup.PREFORK_CHECKS).items():
+        server.log.info("warm-up %s: %s in %sms", name, "ok" if res["ok"] else res.get("error"), res["ms"])
+
+def post_fork(server, worker):
+    # pooled connections opened in the master (schema bootstrap, keyword stats)
+    # belong to it; the worker must open its own
+    from db.session import engine
+
+    engine.dispose(close=False)
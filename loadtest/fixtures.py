@@ -0,0 +1,86 @@
+# backend/loadtest/fixtures.py
+"""Realistic CV / JD payloads for the load harness (generated, so no binary fixtures in git)."""
+import io
+import random
+from typing import List
+
+from docx import Document
+
+CV_LINES: List[str] = [
+    "Jane Doe - Senior Software Engineer",
+    "Summary",
+    "Backend engineer with 8 years of experience building Python and Go services on AWS.",
+    "Experience",
+    "- Led a team of 5 engineers delivering a FastAPI platform serving 2M requests per day.",
+    "- Migrated monolith to Docker and Kubernetes, cutting deploy time by 70%.",
+    "- Built CI/CD pipelines with Terraform and GitHub Actions; owned on-call rotation.",
+    "- Mentoring junior engineers; stakeholder management with product and sales.",
+    "- Designed PostgreSQL and Redis data models for reporting with strict SLAs.",
+    "Education",
+    "MSc Computer Science, BSc Mathematics",
+    "Skills",
+    "Python, Go, SQL, PostgreSQL, Redis, Docker, Kubernetes, AWS, Terraform, Linux, Git",
+    "Certifications",
+    "AWS Certified Solutions Architect, Scrum Master",
+]
+
+JOB_DESCRIPTION = """Senior Backend Engineer (Remote, full-time)
+
+Requirements:
+- Must have strong Python and SQL; PostgreSQL required.
+- Experience with Docker and Kubernetes is mandatory.
+- You need to be comfortable owning CI/CD and on-call.
+Nice to have:
+- Terraform, AWS certified, Go is a plus.
+- Mentoring and stakeholder management preferred.
+Benefits: salary review, hybrid option, relocation support.
+"""
+
+def cv_text() -> str:
+    return "\n".join(CV_LINES)
+
+def docx_bytes(lines: List[str] = CV_LINES) -> bytes:
+    doc = Document()
+    for line in lines:
+        doc.add_paragraph(line)
+    buf = io.BytesIO()
+    doc.save(buf)
+    return buf.getvalue()
+
+def _pdf_escape(s: str) -> str:
+    return s.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+def pdf_bytes(lines: List[str] = CV_LINES, padding: int = 0) -> bytes:
+    """Single-page text PDF (Helvetica) that pdfplumber can extract; no extra dependencies.
+
+    ``padding`` adds an unreferenced binary object of that many bytes, which
+    makes a large upload that is still cheap to parse (memory tests). The bytes
+    are random like a compressed stream; a run of one repeated byte with no CR
+    would hit python-multipart's slow per-byte path and skew timings.
+    """
+    stream = "BT /F1 10 Tf 50 760 Td 14 TL\n" + "".join(
+        f"({_pdf_escape(line)}) Tj T*\n" for line in lines
+    ) + "ET"
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        "<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+        "/Resources << /Font << /F1 5 0 R >> >> /Contents 4 0 R >>",
+        f"<< /Length {len(stream.encode('latin-1'))} >>\nstream\n{stream}\nendstream",
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    if padding:
+        blob = random.Random(padding).randbytes(padding).decode("latin-1")
+        objects.append(f"<< /Length {padding} >>\nstream\n{blob}\nendstream")
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for i, obj in enumerate(objects, start=1):
+        offsets.append(out.tell())
+        out.write(f"{i} 0 obj\n{obj}\nendobj\n".encode("latin-1"))
+    xref = out.tell()
+    out.write(f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode("latin-1"))
+    for off in offsets:
+        out.write(f"{off:010d} 00000 n \n".encode("latin-1"))
+    out.write(f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode("latin-1"))
+    return out.getvalue()
@@ -0,0 +1,290 @@
+# backend/loadtest/run.py
+"""Offline load harness: boot the API under gunicorn, replay a scenario mix, save JSON.
+
+Examples (from the backend directory):
+    python -m loadtest.run --workers 1,2,4 --rps 20 --duration 60 --mix default
+    python -m loadtest.run --ai mock --mix editing --rps 50
+    python -m loadtest.run compare loadtest/results/a.json loadtest/results/b.json
+
+By default the app runs with the real OpenAI code path pointed at a local stub
+LLM (``--ai stub``, latency set by ``--llm-latency-ms``); ``--ai mock`` uses the
+built-in heuristic provider and no LLM at all. Each worker count gets a fresh
+SQLite DB unless ``--database-url`` is given.
+
+Latency is measured from each request's *scheduled* start, so a saturated
+server shows up as queueing delay instead of silently lowering the offered load.
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import socket
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import requests
+
+from loadtest import scenarios
+from loadtest.stub_llm import StubLLM
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_OUT = os.path.join(BACKEND_DIR, "loadtest", "results")
+
+# --- stats --------------------------------------------------------------------
+def percentile(sorted_xs: List[float], p: float) -> Optional[float]:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_xs:
+        return None
+    k = max(0, min(len(sorted_xs) - 1, math.ceil(p * len(sorted_xs) / 100.0) - 1))
+    return sorted_xs[k]
+
+def summarize(samples: List[dict], wall_s: float) -> dict:
+    lat = sorted(s["latency_ms"] for s in samples)
+    errors = sum(1 for s in samples if not s["ok"])
+    codes: Dict[str, int] = {}
+    for s in samples:
+        codes[str(s["status"])] = codes.get(str(s["status"]), 0) + 1
+    return {
+        "count": len(samples),
+        "errors": errors,
+        "error_rate": round(errors / len(samples), 4) if samples else 0.0,
+        "throughput_rps": round((len(samples) - errors) / wall_s, 2) if wall_s else 0.0,
+        "p50_ms": _r(percentile(lat, 50)),
+        "p95_ms": _r(percentile(lat, 95)),
+        "p99_ms": _r(percentile(lat, 99)),
+        "mean_ms": _r(sum(lat) / len(lat)) if lat else None,
+        "max_ms": _r(lat[-1]) if lat else None,
+        "status_codes": codes,
+    }
+
+def _r(x: Optional[float]) -> Optional[float]:
+    return round(x, 1) if x is not None else None
+
+# --- server -------------------------------------------------------------------
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def _wait_healthy(base_url: str, proc: subprocess.Popen, timeout: float = 60.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"server exited with code {proc.returncode}")
+        try:
+            # /ready, not /health: measurements must not include worker warm-up
+            if requests.get(base_url + "/ready", timeout=5).ok:
+                return
+        except requests.RequestException:
+            pass
+        time.sleep(0.25)
+    raise RuntimeError("server did not become healthy in time")
+
+class Server:
+    """gunicorn + uvicorn workers, configured like the Dockerfile except for -w."""
+
+    def __init__(self, workers: int, env: Dict[str, str], log_path: str):
+        self.port = _free_port()
+        self.base_url = f"http://127.0.0.1:{self.port}"
+        self.workers = workers
+        self.env = env
+        self.log_path = log_path
+        self.proc: Optional[subprocess.Popen] = None
+
+    def __enter__(self) -> "Server":
+        # create the schema once, so workers don't race on create_all/ALTERs
+        subprocess.run([sys.executable, "-c", "import app"], cwd=BACKEND_DIR, env=self.env,
+                       check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        self._log = open(self.log_path, "w")
+        self.proc = subprocess.Popen(
+            [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "app:app",
+             "-b", f"127.0.0.1:{self.port}", "-w", str(self.workers)],
+            cwd=BACKEND_DIR, env=self.env, stdout=self._log, stderr=subprocess.STDOUT,
+        )
+        _wait_healthy(self.base_url, self.proc)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if self.proc and self.proc.poll() is None:
+            self.proc.terminate()
+            try:
+                self.proc.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                self.proc.kill()
+        self._log.close()
+
+# --- load ---------------------------------------------------------------------
+def _setup_users(client: scenarios.Client, n: int, db_path: Optional[str]) -> List[scenarios.VirtualUser]:
+    users = []
+    for i in range(n):
+        email, password = f"vu-{i}-{int(time.time())}@loadtest.local", "loadtest-pw"
+        r = client.post("/auth/register", json={"email": email, "password": password})
+        r.raise_for_status()
+        users.append(scenarios.VirtualUser(email, password, r.json()["access_token"]))
+    if db_path:
+        # /api/rewrite is pro-only; the harness owns this throwaway DB
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("UPDATE users SET is_pro = 1 WHERE email LIKE 'vu-%@loadtest.local'")
+    return users
+
+def run_load(base_url: str, users: List[scenarios.VirtualUser], mix: str, rps: float,
+             duration: float, max_in_flight: int, seed: int) -> dict:
+    client = scenarios.Client(base_url)
+    pick = scenarios.picker(mix, seed)
+    total = int(rps * duration)
+    samples: List[dict] = []
+    lock = threading.Lock()
+
+    def fire(name: str, user: scenarios.VirtualUser, scheduled: float) -> None:
+        status, ok = 0, False
+        try:
+            resp = scenarios.SCENARIOS[name](client, user)
+            status, ok = resp.status_code, resp.status_code < 400
+        except requests.RequestException as e:
+            status = type(e).__name__
+        latency_ms = (time.perf_counter() - scheduled) * 1000.0
+        with lock:
+            samples.append({"endpoint": name, "status": status, "ok": ok, "latency_ms": latency_ms})
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max_in_flight) as pool:
+        for i in range(total):
+            scheduled = start + i / rps
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            pool.submit(fire, pick(), users[i % len(users)], scheduled)
+    wall = time.perf_counter() - start
+
+    by_endpoint: Dict[str, List[dict]] = {}
+    for s in samples:
+        by_endpoint.setdefault(s["endpoint"], []).append(s)
+    return {
+        "overall": summarize(samples, wall),
+        "endpoints": {k: summarize(v, wall) for k, v in sorted(by_endpoint.items())},
+        "wall_s": round(wall, 2),
+    }
+
+def _git_rev() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except Exception:
+        return None
+
+def _print_report(result: dict) -> None:
+    m = result["meta"]
+    print(f"\n== workers={m['workers']} mix={m['mix']} rps={m['rps']} ai={m['ai']} ==")
+    print(f"{'endpoint':<20}{'count':>7}{'err%':>7}{'rps':>8}{'p50':>9}{'p95':>9}{'p99':>9}")
+    rows = list(result["endpoints"].items()) + [("ALL", result["overall"])]
+    for name, s in rows:
+        print(f"{name:<20}{s['count']:>7}{s['error_rate'] * 100:>6.1f}%{s['throughput_rps']:>8}"
+              f"{s['p50_ms'] or 0:>9.0f}{s['p95_ms'] or 0:>9.0f}{s['p99_ms'] or 0:>9.0f}")
+
+def run(args) -> List[str]:
+    os.makedirs(args.out, exist_ok=True)
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    written = []
+    for workers in [int(w) for w in args.workers.split(",")]:
+        with ExitStack() as stack:
+            tmp = stack.enter_context(tempfile.TemporaryDirectory(prefix="cvopt-load-"))
+            db_path = None if args.database_url else os.path.join(tmp, "load.db")
+            env = dict(os.environ)
+            env["DATABASE_URL"] = args.database_url or f"sqlite:///{db_path}"
+            env["EMAIL_DEV_LOG"] = "true"
+            if args.ai == "stub":
+                stub = stack.enter_context(StubLLM(0, args.llm_latency_ms, args.llm_jitter_ms, args.llm_error_rate))
+                env.update(AI_PROVIDER="openai", OPENAI_API_KEY="sk-loadtest", OPENAI_BASE_URL=stub.base_url)
+            else:
+                env["AI_PROVIDER"] = "mock"
+
+            server = stack.enter_context(Server(workers, env, os.path.join(tmp, "server.log")))
+            users = _setup_users(scenarios.Client(server.base_url), args.users, db_path)
+            if args.warmup:
+                run_load(server.base_url, users, args.mix, args.rps, args.warmup, args.max_in_flight, args.seed + 1)
+            stats = run_load(server.base_url, users, args.mix, args.rps, args.duration, args.max_in_flight, args.seed)
+
+        result = {
+            "meta": {
+                "timestamp": stamp, "git_rev": _git_rev(), "host": platform.node(),
+                "cpu_count": os.cpu_count(), "workers": workers, "mix": args.mix,
+                "mix_weights": scenarios.MIXES[args.mix], "rps": args.rps, "duration_s": args.duration,
+                "users": args.users, "ai": args.ai,
+                "llm_latency_ms": args.llm_latency_ms if args.ai == "stub" else None,
+            },
+            **stats,
+        }
+        _print_report(result)
+        path = os.path.join(args.out, f"{stamp}-{args.mix}-w{workers}.json")
+        with open(path, "w") as f:
+            json.dump(result, f, indent=2)
+        written.append(path)
+        print(f"saved {path}")
+    return written
+
+def compare(paths: List[str]) -> None:
+    """Side-by-side p50/p95/p99/throughput per endpoint; the first file is the baseline."""
+    runs = []
+    for p in paths:
+        with open(p) as f:
+            runs.append((os.path.basename(p), json.load(f)))
+    base_name, base = runs[0]
+    endpoints = sorted(set().union(*(r["endpoints"] for _, r in runs))) + ["ALL"]
+
+    def stats(run: dict, ep: str) -> Optional[dict]:
+        return run["overall"] if ep == "ALL" else run["endpoints"].get(ep)
+
+    for metric in ("p50_ms", "p95_ms", "p99_ms", "throughput_rps", "error_rate"):
+        print(f"\n{metric} (baseline: {base_name})")
+        print(f"{'endpoint':<20}" + "".join(f"{name[-22:]:>24}" for name, _ in runs))
+        for ep in endpoints:
+            b = stats(base, ep)
+            cells = []
+            for _, r in runs:
+                s = stats(r, ep)
+                v = s.get(metric) if s else None
+                bv = b.get(metric) if b else None
+                if v is None:
+                    cells.append(f"{'-':>24}")
+                elif bv and r is not base:
+                    cells.append(f"{v:>14} ({(v - bv) / bv * 100:+6.1f}%)")
+                else:
+                    cells.append(f"{v:>24}")
+            print(f"{ep:<20}" + "".join(cells))
+
+def main(argv: Optional[List[str]] = None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == "compare":
+        if len(argv) < 3:
+            sys.exit("usage: python -m loadtest.run compare BASELINE.json OTHER.json [...]")
+        compare(argv[1:])
+        return
+
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--workers", default="2", help="comma-separated gunicorn worker counts, e.g. 1,2,4")
+    ap.add_argument("--mix", default="default", choices=sorted(scenarios.MIXES))
+    ap.add_argument("--rps", type=float, default=10.0, help="offered load (requests/second)")
+    ap.add_argument("--duration", type=float, default=30.0, help="seconds of measured load")
+    ap.add_argument("--warmup", type=float, default=5.0, help="seconds of unmeasured load first")
+    ap.add_argument("--users", type=int, default=10, help="virtual users registered before the run")
+    ap.add_argument("--max-in-flight", type=int, default=256)
+    ap.add_argument("--ai", choices=("stub", "mock"), default="stub")
+    ap.add_argument("--llm-latency-ms", type=float, default=800.0)
+    ap.add_argument("--llm-jitter-ms", type=float, default=200.0)
+    ap.add_argument("--llm-error-rate", type=float, default=0.0)
+    ap.add_argument("--database-url", default=None, help="use this DB instead of a throwaway SQLite file")
+    ap.add_argument("--seed", type=int, default=42)
+    ap.add_argument("--out", default=DEFAULT_OUT)
+    run(ap.parse_args(argv))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+# backend/loadtest/scenarios.py
+"""Request scenarios and weighted mixes replayed by loadtest.run.
+
+A scenario is one HTTP call: ``fn(client, user) -> requests.Response``. ``user``
+is a pre-registered virtual user (email, password, token) owned by the harness.
+"""
+import itertools
+import random
+import uuid
+from typing import Callable, Dict, NamedTuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from loadtest import fixtures
+
+class VirtualUser(NamedTuple):
+    email: str
+    password: str
+    token: str
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {self.token}", "Accept-Encoding": "gzip"}
+
+class Client:
+    """Thin wrapper so every scenario hits the same base URL with a shared pool."""
+
+    def __init__(self, base_url: str, timeout: float = 60.0):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=256)
+        self.session.mount("http://", adapter)
+
+    def post(self, path: str, **kw) -> requests.Response:
+        return self.session.post(self.base_url + path, timeout=self.timeout, **kw)
+
+    def get(self, path: str, **kw) -> requests.Response:
+        return self.session.get(self.base_url + path, timeout=self.timeout, **kw)
+
+_PDF = fixtures.pdf_bytes()
+_DOCX = fixtures.docx_bytes()
+_CV = fixtures.cv_text()
+_JD = fixtures.JOB_DESCRIPTION
+_DOCX_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+_seq = itertools.count()
+
+def register(client: Client, user: VirtualUser) -> requests.Response:
+    email = f"lt-{uuid.uuid4().hex[:12]}@loadtest.local"
+    return client.post("/auth/register", json={"email": email, "password": "loadtest-pw"})
+
+def login(client: Client, user: VirtualUser) -> requests.Response:
+    return client.post("/auth/login", json={"email": user.email, "password": user.password})
+
+def upload_pdf(client: Client, user: VirtualUser) -> requests.Response:
+    return client.post("/resumes/upload", headers=user.headers,
+                       files={"file": ("cv.pdf", _PDF, "application/pdf")})
+
+def upload_docx(client: Client, user: VirtualUser) -> requests.Response:
+    return client.post("/resumes/upload", headers=user.headers,
+                       files={"file": ("cv.docx", _DOCX, _DOCX_TYPE)})
+
+def analyze_pdf(client: Client, user: VirtualUser) -> requests.Response:
+    return client.post("/api/analyze", headers=user.headers, data={"job_description": _JD},
+                       files={"file": ("cv.pdf", _PDF, "application/pdf")})
+
+def analyze_docx(client: Client, user: VirtualUser) -> requests.Response:
+    return client.post("/api/analyze", headers=user.headers, data={"job_description": _JD},
+                       files={"file": ("cv.docx", _DOCX, _DOCX_TYPE)})
+
+def analyze_text(client: Client, user: VirtualUser) -> requests.Response:
+    # a small edit per call, like a user iterating on their CV
+    cv = _CV + f"\n- Improved reporting latency by {next(_seq) % 90 + 10}%."
+    return client.post("/api/analyze/text", headers=user.headers, data={"cv_text": cv, "job_description": _JD})
+
+def analyze_text_no_ai(client: Client, user: VirtualUser) -> requests.Response:
+    return client.post("/api/analyze/text?include_ai=false", headers=user.headers,
+                       data={"cv_text": _CV, "job_description": _JD})
+
+def rewrite(client: Client, user: VirtualUser) -> requests.Response:
+    return client.post("/api/rewrite", headers=user.headers, data={"cv_text": _CV, "job_description": _JD})
+
+def history(client: Client, user: VirtualUser) -> requests.Response:
+    return client.get("/api/analyses?limit=20", headers=user.headers)
+
+SCENARIOS: Dict[str, Callable[[Client, VirtualUser], requests.Response]] = {
+    "register": register,
+    "login": login,
+    "upload_pdf": upload_pdf,
+    "upload_docx": upload_docx,
+    "analyze_pdf": analyze_pdf,
+    "analyze_docx": analyze_docx,
+    "analyze_text": analyze_text,
+    "analyze_text_no_ai": analyze_text_no_ai,
+    "rewrite": rewrite,
+    "history": history,
+}
+
+# weights, not percentages
+MIXES: Dict[str, Dict[str, int]] = {
+    # roughly what the dashboard produces during a normal day
+    "default": {
+        "register": 1, "login": 4, "upload_pdf": 8, "upload_docx": 7,
+        "analyze_pdf": 15, "analyze_docx": 15, "analyze_text": 30,
+        "rewrite": 5, "history": 15,
+    },
+    # users iterating on a CV against one JD
+    "editing": {"analyze_text": 70, "analyze_text_no_ai": 20, "history": 10},
+    # parsing-heavy: shows CPU saturation per worker
+    "uploads": {"upload_pdf": 40, "upload_docx": 30, "analyze_pdf": 15, "analyze_docx": 15},
+    # bcrypt-bound
+    "auth": {"register": 30, "login": 70},
+}
+
+def picker(mix: str, seed: int = 0) -> Callable[[], str]:
+    if mix not in MIXES:
+        raise ValueError(f"unknown mix '{mix}' (choose from {', '.join(MIXES)})")
+    names = list(MIXES[mix])
+    weights = [MIXES[mix][n] for n in names]
+    rng = random.Random(seed)
+    return lambda: rng.choices(names, weights)[0]
@@ -0,0 +1,102 @@
+# backend/loadtest/stub_llm.py
+"""OpenAI-compatible chat-completions stub with configurable latency.
+
+Run standalone:
+    python -m loadtest.stub_llm --port 9100 --latency-ms 800 --jitter-ms 200
+then start the API with AI_PROVIDER=openai OPENAI_BASE_URL=http://127.0.0.1:9100/v1.
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+CANNED = json.dumps({
+    "score": 72,
+    "missing_keywords": ["kubernetes", "terraform"],
+    "strengths": ["python", "aws"],
+    "issues": ["few quantified achievements"],
+    "suggestions": ["Add metrics to the top three bullets."],
+})
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "stub-llm/1.0"
+
+    def do_POST(self):  # noqa: N802 (http.server naming)
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length) or b"{}")
+        cfg = self.server.stub_config
+
+        delay = max(0.0, random.gauss(cfg["latency_ms"], cfg["jitter_ms"])) / 1000.0
+        time.sleep(delay)
+        if cfg["error_rate"] and random.random() < cfg["error_rate"]:
+            self._send(503, {"error": {"message": "stub overloaded", "type": "server_error"}})
+            return
+
+        self._send(200, {
+            "id": "chatcmpl-stub",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "stub"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": CANNED},
+                "finish_reason": "stop",
+            }],
+            "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+        })
+
+    def _send(self, status: int, payload: dict) -> None:
+        data = json.dumps(payload).encode("utf-8")
+        try:
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # the client hit its deadline and hung up; that's the point of a slow stub
+
+    def log_message(self, *args):  # keep load-test output readable
+        pass
+
+class StubLLM:
+    """Background stub server; use as a context manager."""
+
+    def __init__(self, port: int = 0, latency_ms: float = 800, jitter_ms: float = 0, error_rate: float = 0.0):
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", port), _Handler)
+        self.httpd.daemon_threads = True
+        self.httpd.stub_config = {"latency_ms": latency_ms, "jitter_ms": jitter_ms, "error_rate": error_rate}
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="stub-llm", daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def __enter__(self) -> "StubLLM":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--port", type=int, default=9100)
+    ap.add_argument("--latency-ms", type=float, default=800)
+    ap.add_argument("--jitter-ms", type=float, default=200)
+    ap.add_argument("--error-rate", type=float, default=0.0)
+    args = ap.parse_args()
+    with StubLLM(args.port, args.latency_ms, args.jitter_ms, args.error_rate) as stub:
+        print(f"stub LLM listening on {stub.base_url} (latency {args.latency_ms}±{args.jitter_ms} ms)")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+
+if __name__ == "__main__":
+    main()
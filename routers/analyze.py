@@ -1,12 +1,26 @@
 # backend/routers/analyze.py
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Header, Depends
+import asyncio
+import json
+import os
+from typing import List, Optional
+
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Header, Depends, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
+from core.config import settings
+from core.deadline import Deadline
+from core.etag import cache_headers, etag_matches, make_etag, not_modified, sha256_hex
 from db.session import SessionLocal
+from db.models import Resume
 from routers.auth import get_current_user_id
-from services import parser
-from services.ats import ats_score
-from services.ai import ai_suggestions
+from services import bulk, parser, uploads
+from services.ats import BANK_VERSION, ats_score, prepare_jd, prepare_jd_cached
+from services.ai import ai_suggestions, ai_suggestions_async
+from services.analysis_store import record_analysis
+from services.keywords import corpus
+from services.pipeline import Pipeline, Stage
 
 router = APIRouter(prefix="/analyze", tags=["analyze"])
 
@@ -17,45 +31,266 @@ def get_db():
     finally:
         db.close()
 
+def _require_own_resume(db: Session, uid: int, resume_id: Optional[int]) -> None:
+    """404 unless resume_id is None or names a resume the caller owns."""
+    if resume_id is None:
+        return
+    owned = db.query(Resume.id).filter(Resume.id == resume_id, Resume.owner_id == uid).first()
+    if not owned:
+        raise HTTPException(404, "Resume not found")
+
+def _result_etag(kind: str, cv_digest: str, job_description: str, include_ai: bool) -> Optional[str]:
+    """ETag for a deterministic analysis, or None when the body may vary (live LLM output)."""
+    provider = (settings.AI_PROVIDER or "mock").lower()
+    if include_ai and provider != "mock":
+        return None
+    ai_part = "ai:mock" if include_ai else "ai:off"
+    # weak: the body also carries per-request stage timings, and top_keywords
+    # scores drift with the (per-worker) corpus statistics. Neither changes what
+    # the analysis says, so neither belongs in the validator.
+    return make_etag(kind, cv_digest, sha256_hex(job_description), BANK_VERSION, ai_part, weak=True)
+
+# --- Analysis pipelines -------------------------------------------------------
+# JD preparation doesn't need the CV, and the AI call doesn't need ATS results,
+# so after parsing those run side by side; the AI call waits on the loop.
+def _cv(ctx: dict) -> str:
+    return ctx["parse"] if "parse" in ctx else ctx["cv_text"]
+
+def _parse_stage(ctx: dict) -> str:
+    text = parser.extract_text_file(ctx["upload"], filename=ctx["filename"])
+    if not text.strip():
+        raise HTTPException(400, "Could not extract text from the uploaded file")
+    return text
+
+def _jd_stage(ctx: dict) -> dict:
+    return prepare_jd_cached(ctx["job_description"])
+
+def _ats_stage(ctx: dict) -> dict:
+    return ats_score(_cv(ctx), ctx["job_description"], jd=ctx["jd"], incremental=ctx["incremental"])
+
+async def _ai_stage(ctx: dict) -> dict:
+    return await ai_suggestions_async(_cv(ctx), ctx["job_description"], budget_s=ctx["deadline"].remaining())
+
+def _wants_ai(ctx: dict) -> bool:
+    return ctx["include_ai"]
+
+ANALYZE_FILE = Pipeline([
+    Stage("parse", _parse_stage),
+    Stage("jd", _jd_stage),
+    Stage("ats", _ats_stage, deps=("parse", "jd")),
+    Stage("ai", _ai_stage, deps=("parse",), kind="io", when=_wants_ai),
+])
+
+ANALYZE_TEXT = Pipeline([
+    Stage("jd", _jd_stage),
+    Stage("ats", _ats_stage, deps=("jd",)),
+    Stage("ai", _ai_stage, kind="io", when=_wants_ai),
+])
+
 @router.post("", response_model=None)
 async def analyze_cv(
+    response: Response,
     file: UploadFile = File(...),
     job_description: str = Form(...),
+    resume_id: Optional[int] = Form(default=None),
     authorization: str = Header(default=None),
+    if_none_match: Optional[str] = Header(default=None),
     include_ai: bool = True,
     db: Session = Depends(get_db),
 ):
     uid = get_current_user_id(authorization.replace("Bearer ", "")) if authorization else None
     if not uid:
         raise HTTPException(401, "Unauthorized")
+    await run_in_threadpool(_require_own_resume, db, uid, resume_id)
+    deadline = Deadline(settings.AI_BUDGET_MS)
 
-    content = await file.read()
-    cv_text = parser.extract_text_bytes(content, filename=file.filename or "")
-    if not cv_text.strip():
-        raise HTTPException(400, "Could not extract text from the uploaded file")
+    # the upload stays in its spooled temp file; hash and parse read from there
+    uploads.ensure_size(file, settings.UPLOAD_MAX_BYTES)
+    digest = await run_in_threadpool(uploads.file_sha256, file.file)
+    etag = _result_etag(f"file:{file.filename}", digest, job_description, include_ai)
+    if etag and etag_matches(if_none_match, etag):
+        return not_modified(etag)
 
-    ats = ats_score(cv_text, job_description)
-    ai = ai_suggestions(cv_text, job_description) if include_ai else None
-
-    return {
+    run = await ANALYZE_FILE.run({
+        "upload": file.file,
+        "filename": file.filename or "",
+        "job_description": job_description,
+        "include_ai": include_ai,
+        "incremental": False,
+        "deadline": deadline,
+    })
+    cv_text = run.results["parse"]
+    result = {
         "filename": file.filename,
         "length_cv_chars": len(cv_text),
-        "ats": ats,
-        "ai": ai,
+        "ats": run.results["ats"],
+        "ai": run.results["ai"],
     }
+    record_analysis(uid, job_description, result, resume_id=resume_id)
+    await run_in_threadpool(corpus.observe_many, [job_description, cv_text])
+    response.headers["Server-Timing"] = run.server_timing()
+    if etag:
+        response.headers.update(cache_headers(etag))
+    return {**result, "timings": run.timings}
 
 @router.post("/text", response_model=None)
 async def analyze_text(
+    response: Response,
     cv_text: str = Form(...),
     job_description: str = Form(...),
+    resume_id: Optional[int] = Form(default=None),
     authorization: str = Header(default=None),
+    if_none_match: Optional[str] = Header(default=None),
     include_ai: bool = True,
     db: Session = Depends(get_db),
 ):
     uid = get_current_user_id(authorization.replace("Bearer ", "")) if authorization else None
     if not uid:
         raise HTTPException(401, "Unauthorized")
+    await run_in_threadpool(_require_own_resume, db, uid, resume_id)
+    deadline = Deadline(settings.AI_BUDGET_MS)
+
+    etag = _result_etag("text", sha256_hex(cv_text), job_description, include_ai)
+    if etag and etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    run = await ANALYZE_TEXT.run({
+        "cv_text": cv_text,
+        "job_description": job_description,
+        "include_ai": include_ai,
+        # users resubmit small edits of the same CV; only changed lines are re-matched
+        "incremental": True,
+        "deadline": deadline,
+    })
+    result = {"ats": run.results["ats"], "ai": run.results["ai"]}
+    record_analysis(uid, job_description, result, resume_id=resume_id)
+    await run_in_threadpool(corpus.observe_many, [job_description, cv_text])
+    response.headers["Server-Timing"] = run.server_timing()
+    if etag:
+        response.headers.update(cache_headers(etag))
+    return {**result, "timings": run.timings}
+
+# --- Bulk scoring -------------------------------------------------------------
+def _save_resume(uid: int, name: str, text: str, size: int) -> Optional[int]:
+    db = SessionLocal()
+    try:
+        base = os.path.basename(name)
+        res = Resume(
+            owner_id=uid,
+            filename=base,
+            original_filename=name,
+            path="",
+            text=text,
+            file_size=size,
+            file_type=os.path.splitext(base.lower())[1].lstrip("."),
+        )
+        db.add(res)
+        db.commit()
+        db.refresh(res)
+        return res.id
+    finally:
+        db.close()
+
+def _close_all(spools) -> None:
+    for spool in spools:
+        spool.close()
+
+async def _bulk_item(member: bulk.Member, uid: int, job_description: str, jd: dict, include_ai: bool) -> dict:
+    line = {"index": member.index, "filename": member.name}
+    deadline = Deadline(settings.AI_BUDGET_MS)
+    if member.error:
+        return {**line, "ok": False, "error": member.error}
+    try:
+        content = await run_in_threadpool(member.load)
+        pool = bulk.get_pool()
+        if pool is not None:
+            loop = asyncio.get_running_loop()
+            scored = await loop.run_in_executor(
+                pool, bulk.parse_and_score, member.name, content, job_description, jd
+            )
+        else:
+            scored = await run_in_threadpool(bulk.parse_and_score, member.name, content, job_description, jd)
+        if scored["ats"] is None:
+            return {**line, "ok": False, "error": "Could not extract text from the uploaded file"}
+
+        cv_text = scored["text"]
+        await run_in_threadpool(corpus.observe, cv_text)
+        if pool is not None:
+            # worker processes have no corpus statistics; rank the CV's keywords here
+            scored["ats"]["top_keywords"]["cv"] = await run_in_threadpool(corpus.top, cv_text, 20)
+        ai = None
+        if include_ai:
+            ai = await run_in_threadpool(ai_suggestions, cv_text, job_description, deadline.remaining())
+        result = {"filename": member.name, "length_cv_chars": len(cv_text), "ats": scored["ats"], "ai": ai}
+        resume_id = await run_in_threadpool(_save_resume, uid, member.name, cv_text, len(content))
+        record_analysis(uid, job_description, result, resume_id=resume_id)
+        return {**line, "ok": True, "resume_id": resume_id, **result}
+    except Exception as e:
+        return {**line, "ok": False, "error": str(e) or e.__class__.__name__}
+
+async def _bulk_stream(members, spools, uid: int, job_description: str, jd: dict, include_ai: bool):
+    sem = asyncio.Semaphore(max(1, settings.BULK_CONCURRENCY))
+
+    async def bounded(member):
+        async with sem:
+            return await _bulk_item(member, uid, job_description, jd, include_ai)
+
+    tasks = [asyncio.create_task(bounded(m)) for m in members]
+    ok = 0
+    try:
+        for fut in asyncio.as_completed(tasks):
+            item = await fut
+            ok += bool(item.get("ok"))
+            yield json.dumps(item, default=str) + "\n"
+        yield json.dumps({"done": True, "total": len(members), "ok": ok, "failed": len(members) - ok}) + "\n"
+    finally:
+        # client went away: don't keep scoring CVs nobody will read
+        for t in tasks:
+            t.cancel()
+        _close_all(spools)
+
+@router.post("/bulk", response_model=None)
+async def analyze_bulk(
+    job_description: str = Form(...),
+    archive: Optional[UploadFile] = File(default=None),
+    files: Optional[List[UploadFile]] = File(default=None),
+    authorization: str = Header(default=None),
+    include_ai: bool = False,
+):
+    """Score a ZIP and/or a multipart batch of CVs against one JD; streams NDJSON, one line per CV."""
+    uid = get_current_user_id(authorization.replace("Bearer ", "")) if authorization else None
+    if not uid:
+        raise HTTPException(401, "Unauthorized")
+    if archive is None and not files:
+        raise HTTPException(400, "Send a ZIP as 'archive' or one or more 'files'")
+
+    # uploads are closed once this handler returns, so take our own copies first
+    spools = []
+    members: List[bulk.Member] = []
+    try:
+        if archive is not None:
+            spool = await run_in_threadpool(bulk.spool_copy, archive.file, settings.UPLOAD_SPOOL_MEMORY_BYTES)
+            spools.append(spool)
+            members += bulk.zip_members(spool)
+        for f in files or []:
+            spool = await run_in_threadpool(bulk.spool_copy, f.file, settings.UPLOAD_SPOOL_MEMORY_BYTES)
+            spools.append(spool)
+            members.append(bulk.spool_member(len(members), f.filename or f"file-{len(members)}", spool))
+        if not members:
+            raise ValueError("No CVs found in the upload")
+    except ValueError as e:
+        _close_all(spools)
+        raise HTTPException(400, str(e))
+    if len(members) > settings.BULK_MAX_FILES:
+        _close_all(spools)
+        raise HTTPException(413, f"At most {settings.BULK_MAX_FILES} CVs per batch")
 
-    ats = ats_score(cv_text, job_description)
-    ai = ai_suggestions(cv_text, job_description) if include_ai else None
-    return {"ats": ats, "ai": ai}
+    # the JD is parsed once and shared by every CV in the batch
+    await run_in_threadpool(corpus.observe, job_description)
+    jd = await run_in_threadpool(prepare_jd, job_description)
+    return StreamingResponse(
+        _bulk_stream(members, spools, uid, job_description, jd, include_ai),
+        media_type="application/x-ndjson",
+        # gzip would buffer lines inside the compressor; results must go out as they finish
+        headers={"Content-Encoding": "identity"},
+    )
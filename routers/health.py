@@ -1,8 +1,32 @@
 # backend/routers/health.py
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from core.config import settings
+from services import warmup
+from services.analysis_store import analysis_buffer
+from services.breaker import breaker_states
+from services.keywords import keyword_buffer
 
 router = APIRouter(tags=["health"])
 
 @router.get("/health", response_model=None)
 def health():
     return {"status": "ok"}
+
+@router.get("/ready", response_model=None)
+def ready():
+    """Readiness probe: 200 once every warm-up check passes, 503 with the failing checks otherwise.
+
+    Also reports the write-behind buffers (pending/failed rows) for monitoring;
+    those don't affect readiness.
+    """
+    ok, checks = warmup.readiness()
+    buffers = {"analyses": analysis_buffer.stats(), "keyword_stats": keyword_buffer.stats()}
+    return JSONResponse(status_code=200 if ok else 503,
+                        content={"ready": ok, "checks": checks, "write_behind": buffers})
+
+@router.get("/health/ai", response_model=None)
+def health_ai():
+    """Circuit-breaker state per AI provider/model (for dashboards and alerts)."""
+    return {"provider": settings.AI_PROVIDER, "breakers": breaker_states()}
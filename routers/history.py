@@ -0,0 +1,135 @@
+# backend/routers/history.py
+import json
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Header, Depends, Query, Response
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from core.etag import cache_headers, etag_matches, make_etag, not_modified
+from db.session import SessionLocal
+from db.models import Analysis
+from routers.auth import get_current_user_id
+from services.analysis_store import analysis_buffer
+
+router = APIRouter(prefix="/analyses", tags=["history"])
+
+def get_db():
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+def _require_uid(authorization: Optional[str]) -> int:
+    uid = get_current_user_id(authorization.replace("Bearer ", "")) if authorization else None
+    if not uid:
+        raise HTTPException(401, "Unauthorized")
+    # read-your-writes: anything this worker still holds goes to the DB first
+    if analysis_buffer.pending():
+        analysis_buffer.flush()
+    return uid
+
+def _summary(a: Analysis) -> dict:
+    return {
+        "id": a.id,
+        "resume_id": a.resume_id,
+        "score": a.score,
+        "analysis_type": a.analysis_type,
+        "jd_hash": a.jd_hash,
+        "created_at": a.created_at.isoformat() if a.created_at else None,
+    }
+
+@router.get("", response_model=None)
+def list_analyses(
+    limit: int = Query(20, ge=1, le=100),
+    before: Optional[datetime] = None,
+    authorization: str = Header(default=None),
+    db: Session = Depends(get_db),
+):
+    """Newest first; page with ?before=<created_at of the last item>."""
+    uid = _require_uid(authorization)
+    q = db.query(Analysis).filter(Analysis.owner_id == uid)
+    if before is not None:
+        q = q.filter(Analysis.created_at < before)
+    rows = q.order_by(Analysis.created_at.desc()).limit(limit).all()
+    return {
+        "items": [_summary(a) for a in rows],
+        "next_before": rows[-1].created_at.isoformat() if len(rows) == limit and rows[-1].created_at else None,
+    }
+
+@router.get("/trend", response_model=None)
+def score_trend(
+    resume_id: int,
+    limit: int = Query(50, ge=1, le=500),
+    authorization: str = Header(default=None),
+    db: Session = Depends(get_db),
+):
+    uid = _require_uid(authorization)
+    rows = (
+        db.query(Analysis.id, Analysis.score, Analysis.jd_hash, Analysis.created_at)
+        .filter(Analysis.owner_id == uid, Analysis.resume_id == resume_id)
+        .order_by(Analysis.created_at.desc())
+        .limit(limit)
+        .all()
+    )
+    points = [
+        {"id": r.id, "score": r.score, "jd_hash": r.jd_hash,
+         "created_at": r.created_at.isoformat() if r.created_at else None}
+        for r in reversed(rows)
+    ]
+    return {"resume_id": resume_id, "points": points}
+
+@router.get("/latest-by-jd", response_model=None)
+def latest_by_jd(
+    limit: int = Query(50, ge=1, le=200),
+    authorization: str = Header(default=None),
+    db: Session = Depends(get_db),
+):
+    uid = _require_uid(authorization)
+    latest = (
+        db.query(func.max(Analysis.id).label("id"))
+        .filter(Analysis.owner_id == uid, Analysis.jd_hash.isnot(None))
+        .group_by(Analysis.jd_hash)
+        .subquery()
+    )
+    rows = (
+        db.query(Analysis)
+        .join(latest, Analysis.id == latest.c.id)
+        .order_by(Analysis.created_at.desc())
+        .limit(limit)
+        .all()
+    )
+    items = []
+    for a in rows:
+        item = _summary(a)
+        item["job_description_preview"] = (a.job_description or "")[:200]
+        items.append(item)
+    return {"items": items}
+
+@router.get("/{analysis_id}", response_model=None)
+def get_analysis(
+    analysis_id: int,
+    response: Response,
+    authorization: str = Header(default=None),
+    if_none_match: Optional[str] = Header(default=None),
+    db: Session = Depends(get_db),
+):
+    uid = _require_uid(authorization)
+    a = db.query(Analysis).filter(Analysis.id == analysis_id, Analysis.owner_id == uid).first()
+    if not a:
+        raise HTTPException(404, "Analysis not found")
+
+    # stored analyses are immutable, so id + timestamp identify the body. Weak,
+    # because GZipMiddleware sends gzip and identity bytes under the same tag,
+    # and a strong validator must differ per content-coding (RFC 9110 8.8.3)
+    etag = make_etag("analysis", a.id, a.created_at.isoformat() if a.created_at else "", weak=True)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    response.headers.update(cache_headers(etag))
+
+    out = _summary(a)
+    out["job_description"] = a.job_description
+    out["result"] = json.loads(a.result_json)
+    return out
@@ -1,11 +1,15 @@
 # backend/routers/resume.py
+import os
+
 from fastapi import APIRouter, UploadFile, File, HTTPException, Header, Depends
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
+from core.config import settings
 from db.session import SessionLocal
 from db.models import Resume  # remove these two lines if you don't have the table
 from routers.auth import get_current_user_id
-from services import parser
+from services import parser, uploads
 
 router = APIRouter(prefix="/resumes", tags=["resumes"])
 
@@ -26,20 +30,29 @@ async def upload_resume(
     if not uid:
         raise HTTPException(401, "Unauthorized")
 
-    content = await file.read()
-    text = parser.extract_text_bytes(content, filename=file.filename or "")
+    # parse straight from the spooled upload instead of reading it into memory
+    size = uploads.ensure_size(file, settings.UPLOAD_MAX_BYTES)
+    text = await run_in_threadpool(parser.extract_text_file, file.file, file.filename or "")
     if not text.strip():
         raise HTTPException(400, "Could not extract text from the uploaded file")
 
     saved_id = None
     try:
-        res = Resume(user_id=uid, filename=file.filename, path="", text=text)
+        res = Resume(
+            owner_id=uid,
+            filename=file.filename,
+            original_filename=file.filename,
+            path="",
+            text=text,
+            file_size=size,
+            file_type=os.path.splitext((file.filename or "").lower())[1].lstrip("."),
+        )
         db.add(res)
         db.commit()
         db.refresh(res)
         saved_id = res.id
     except Exception:
-        pass
+        db.rollback()
 
     return {"id": saved_id, "filename": file.filename, "characters": len(text), "preview": text[:800]}
 
@@ -1,8 +1,12 @@
 # backend/services/ai.py
+import asyncio
 import os
-from typing import Dict, Any
+import threading
+import time
+from typing import Dict, Any, List, Optional, Tuple
 
 from core.config import settings
+from services.breaker import get_breaker
 
 # Optional tiktoken import (graceful fallback if not installed)
 def _count_tokens(text: str) -> int:
@@ -14,56 +18,14 @@ def _count_tokens(text: str) -> int:
         # Lightweight fallback: ~1 token ~= 0.75 words
         return max(1, int(len((text or "").split()) / 0.75))
 
-def ai_suggestions(cv_text: str, job_description: str) -> Dict[str, Any]:
-    provider = (settings.AI_PROVIDER or "mock").lower()
-
-    if provider == "openai":
-        try:
-            from openai import OpenAI
-            client = OpenAI(api_key=settings.OPENAI_API_KEY)
-
-            system = (
-                "You are an ATS and career expert. "
-                "Analyze the candidate CV against the job description, "
-                "return structured suggestions to improve ATS score, "
-                "keyword alignment, clarity, impact, and formatting. "
-                "Keep it concise and actionable."
-            )
-            user = (
-                f"JOB DESCRIPTION:\n{job_description}\n\n"
-                f"CV TEXT:\n{cv_text}\n\n"
-                "Return JSON with keys: score (0-100), missing_keywords[], strengths[], issues[], suggestions[]"
-            )
-
-            resp = client.chat.completions.create(
-                model=settings.OPENAI_MODEL or "gpt-4o-mini",
-                messages=[{"role": "system", "content": system},
-                          {"role": "user", "content": user}],
-                temperature=0.2,
-            )
-
-            content = resp.choices[0].message.content or ""
-            return {
-                "model": settings.OPENAI_MODEL or "gpt-4o-mini",
-                "raw": content,
-                "tokens_estimate": _count_tokens(cv_text + "\n" + job_description),
-            }
-        except Exception as e:
-            # Fallback to mock if OpenAI fails
-            return {
-                "model": "mock",
-                "raw": f"[openai_error:{e}] Falling back to heuristic suggestions.",
-                "tokens_estimate": _count_tokens(cv_text + "\n" + job_description),
-            }
-
-    # Mock provider (default)
+def _heuristic_suggestions(cv_text: str, job_description: str, fallback: Optional[str] = None) -> Dict[str, Any]:
     from services.ats import extract_keywords
     jd_kw = extract_keywords(job_description)
     cv_kw = extract_keywords(cv_text)
     missing = [k for k in jd_kw if k.lower() not in (kw.lower() for kw in cv_kw)]
     score = max(10, 100 - 2 * len(missing))
 
-    return {
+    out = {
         "model": "mock",
         "raw": "Heuristic ATS suggestions (no external model).",
         "score": score,
@@ -76,6 +38,184 @@ def ai_suggestions(cv_text: str, job_description: str) -> Dict[str, Any]:
         ],
         "tokens_estimate": _count_tokens(cv_text + "\n" + job_description),
     }
+    if fallback:
+        # why the model was skipped: budget, circuit_open, or openai_error:<...>
+        out["fallback"] = fallback
+        out["raw"] = f"[{fallback}] Falling back to heuristic suggestions."
+    return out
+
+def _suggestion_messages(cv_text: str, job_description: str) -> List[Dict[str, str]]:
+    system = (
+        "You are an ATS and career expert. "
+        "Analyze the candidate CV against the job description, "
+        "return structured suggestions to improve ATS score, "
+        "keyword alignment, clarity, impact, and formatting. "
+        "Keep it concise and actionable."
+    )
+    user = (
+        f"JOB DESCRIPTION:\n{job_description}\n\n"
+        f"CV TEXT:\n{cv_text}\n\n"
+        "Return JSON with keys: score (0-100), missing_keywords[], strengths[], issues[], suggestions[]"
+    )
+    return [{"role": "system", "content": system}, {"role": "user", "content": user}]
+
+def _openai_plan(budget_s: Optional[float]):
+    """(model, breaker, fallback reason or None) for an OpenAI suggestions call."""
+    model = settings.OPENAI_MODEL or "gpt-4o-mini"
+    if budget_s is not None and budget_s * 1000 < settings.AI_MIN_BUDGET_MS:
+        return model, None, "budget"
+    breaker = get_breaker("openai", model)
+    if not breaker.allow():
+        return model, breaker, "circuit_open"
+    return model, breaker, None
+
+def _call_timeout(budget_s: Optional[float]) -> float:
+    return budget_s if budget_s is not None else settings.AI_BUDGET_MS / 1000.0
+
+def _is_timeout(error: BaseException) -> bool:
+    import httpx
+    from openai import APITimeoutError
+    return isinstance(error, (APITimeoutError, httpx.TimeoutException, TimeoutError))
+
+def _failed_call(breaker, error: Exception, budget_s: Optional[float]) -> str:
+    """Settle the breaker for a call that raised; returns the fallback reason.
+
+    A timeout only counts against the provider when the call was allowed at
+    least the breaker's slow-call threshold; a shorter one was cut off by our
+    own remaining budget.
+    """
+    if _is_timeout(error) and _call_timeout(budget_s) < breaker.slow_call_s:
+        breaker.release()
+        return "budget"
+    breaker.record_failure()
+    return f"openai_error:{error}"
+
+# Clients are reused so each call doesn't pay for a new connection pool and TLS
+# handshake. There is one per base URL and key; async clients are also tied to
+# their event loop. Per-call timeouts go to create(). Retries are off because a
+# retry would run straight past the budget.
+_sync_clients: Dict[Tuple, Any] = {}
+_async_clients: Dict[Tuple, Tuple[asyncio.AbstractEventLoop, Any]] = {}
+_clients_lock = threading.Lock()
+
+def _client_key() -> Tuple:
+    return (settings.OPENAI_BASE_URL, settings.OPENAI_API_KEY)
+
+def _sync_client():
+    from openai import OpenAI
+    key = _client_key()
+    with _clients_lock:
+        client = _sync_clients.get(key)
+        if client is None:
+            client = _sync_clients[key] = OpenAI(
+                api_key=settings.OPENAI_API_KEY, base_url=settings.OPENAI_BASE_URL, max_retries=0
+            )
+        return client
+
+def _async_client():
+    from openai import AsyncOpenAI
+    loop = asyncio.get_running_loop()
+    key = _client_key()
+    entry = _async_clients.get(key)
+    if entry is None or entry[0] is not loop:
+        # a client from another (finished) loop can't be reused; drop it
+        entry = _async_clients[key] = (
+            loop,
+            AsyncOpenAI(api_key=settings.OPENAI_API_KEY, base_url=settings.OPENAI_BASE_URL, max_retries=0),
+        )
+    return entry[1]
+
+async def close_clients() -> None:
+    """Close pooled connections (app shutdown)."""
+    loop = asyncio.get_running_loop()
+    for key, (client_loop, client) in list(_async_clients.items()):
+        if client_loop is loop:
+            await client.close()
+        del _async_clients[key]
+    with _clients_lock:
+        for client in _sync_clients.values():
+            client.close()
+        _sync_clients.clear()
+
+def ai_suggestions(cv_text: str, job_description: str, budget_s: Optional[float] = None) -> Dict[str, Any]:
+    """Model suggestions within ``budget_s`` seconds, or heuristics when that can't be met.
+
+    The heuristic answer is returned immediately when the remaining budget is
+    below AI_MIN_BUDGET_MS or the provider's circuit breaker is open; otherwise
+    the call is capped at the remaining budget and its outcome feeds the breaker
+    (except a timeout caused by that cap, see _failed_call).
+    """
+    provider = (settings.AI_PROVIDER or "mock").lower()
+
+    if provider == "openai":
+        model, breaker, fallback = _openai_plan(budget_s)
+        if fallback:
+            return _heuristic_suggestions(cv_text, job_description, fallback=fallback)
+
+        started = time.monotonic()
+        try:
+            resp = _sync_client().chat.completions.create(
+                model=model,
+                messages=_suggestion_messages(cv_text, job_description),
+                temperature=0.2,
+                timeout=_call_timeout(budget_s),
+            )
+            content = resp.choices[0].message.content or ""
+        except Exception as e:
+            return _heuristic_suggestions(cv_text, job_description, fallback=_failed_call(breaker, e, budget_s))
+        except BaseException:
+            # interrupted, so no verdict; hand back the half-open probe slot
+            breaker.release()
+            raise
+
+        breaker.record_success(time.monotonic() - started)
+        return {
+            "model": model,
+            "raw": content,
+            "tokens_estimate": _count_tokens(cv_text + "\n" + job_description),
+        }
+
+    # Mock provider (default)
+    return _heuristic_suggestions(cv_text, job_description)
+
+async def ai_suggestions_async(cv_text: str, job_description: str, budget_s: Optional[float] = None) -> Dict[str, Any]:
+    """ai_suggestions for async callers: the model call waits on the event loop, not a thread."""
+    provider = (settings.AI_PROVIDER or "mock").lower()
+    loop = asyncio.get_running_loop()
+
+    if provider == "openai":
+        model, breaker, fallback = _openai_plan(budget_s)
+        if fallback:
+            return await loop.run_in_executor(None, _heuristic_suggestions, cv_text, job_description, fallback)
+
+        started = time.monotonic()
+        try:
+            resp = await _async_client().chat.completions.create(
+                model=model,
+                messages=_suggestion_messages(cv_text, job_description),
+                temperature=0.2,
+                timeout=_call_timeout(budget_s),
+            )
+            content = resp.choices[0].message.content or ""
+        except Exception as e:
+            return await loop.run_in_executor(
+                None, _heuristic_suggestions, cv_text, job_description, _failed_call(breaker, e, budget_s)
+            )
+        except BaseException:
+            # cancelled (client went away, a sibling stage failed, shutdown): no
+            # verdict, but the half-open probe slot must be handed back
+            breaker.release()
+            raise
+
+        breaker.record_success(time.monotonic() - started)
+        return {
+            "model": model,
+            "raw": content,
+            "tokens_estimate": _count_tokens(cv_text + "\n" + job_description),
+        }
+
+    # Mock provider: heuristics are CPU work, keep them off the loop
+    return await loop.run_in_executor(None, _heuristic_suggestions, cv_text, job_description)
 
 def ai_rewrite(cv_text: str, job_description: str) -> str:
     provider = (settings.AI_PROVIDER or "mock").lower()
@@ -83,7 +223,7 @@ def ai_rewrite(cv_text: str, job_description: str) -> str:
     if provider == "openai":
         try:
             from openai import OpenAI
-            client = OpenAI(api_key=settings.OPENAI_API_KEY)
+            client = OpenAI(api_key=settings.OPENAI_API_KEY, base_url=settings.OPENAI_BASE_URL)
 
             system = (
                 "You rewrite CV content to align with a given job description "
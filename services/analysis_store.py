@@ -0,0 +1,43 @@
+# backend/services/analysis_store.py
+import hashlib
+import json
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from core.config import settings
+from db.models import Analysis
+from db.write_behind import WriteBehindBuffer
+
+# One buffer per worker process; started/stopped from app lifecycle events.
+analysis_buffer = WriteBehindBuffer(
+    Analysis,
+    flush_ms=settings.ANALYSIS_FLUSH_MS,
+    max_rows=settings.ANALYSIS_FLUSH_ROWS,
+    max_pending=settings.ANALYSIS_MAX_PENDING,
+    max_retries=settings.ANALYSIS_FLUSH_RETRIES,
+)
+
+def jd_hash(job_description: str) -> str:
+    return hashlib.sha256((job_description or "").strip().encode("utf-8")).hexdigest()
+
+def record_analysis(
+    owner_id: int,
+    job_description: str,
+    result: Dict[str, Any],
+    resume_id: Optional[int] = None,
+    analysis_type: str = "ats",
+) -> None:
+    """Queue an analysis for persistence; never blocks the request on the DB."""
+    ats = result.get("ats") or {}
+    overall = ats.get("score_overall")
+    analysis_buffer.enqueue({
+        "owner_id": owner_id,
+        "resume_id": resume_id,
+        "job_description": job_description,
+        "jd_hash": jd_hash(job_description),
+        "result_json": json.dumps(result, default=str),
+        "score": int(round(overall * 100)) if overall is not None else None,
+        "analysis_type": analysis_type,
+        # stamp at request time, not flush time, so history order is exact
+        "created_at": datetime.utcnow(),
+    })
@@ -1,8 +1,13 @@
 # backend/services/ats.py
-from typing import Dict, List, Set, Tuple
-from collections import Counter
+from typing import Dict, FrozenSet, List, Optional, Sequence, Set, Tuple
+from collections import OrderedDict
+from functools import lru_cache
 from rapidfuzz import process, fuzz
+import hashlib
 import re
+import threading
+
+from services.keywords import corpus
 
 # Light banks you can extend; keep lowercase phrases
 TECH = {
@@ -25,7 +30,20 @@ CERTS = {"aws certified","azure certified","gcp certified","pmp","scrum master",
 CONDITIONS = {"full-time","part-time","contract","internship","remote","hybrid","on-site","visa","relocation","travel","shift","weekend","overtime","salary","benefits"}
 
 ALL = list(TECH | SOFT | BUSINESS | EDU | CERTS | CONDITIONS)
-TOKEN_RE = re.compile(r"[A-Za-z0-9\+\#\.]+(?:\s[A-Za-z0-9\+\#\.]+)*")
+
+# Bump when the matching logic changes in a way that alters results
+_SCORER_REV = 5  # 2: CV matched per line window; 3: TF-IDF top_keywords; 4: windows match like the whole text; 5: boilerplate stopwords, phrases gated on df
+
+# Changes whenever a bank is edited, so cached/ETagged ATS results invalidate themselves
+BANK_VERSION = hashlib.sha256(
+    repr((_SCORER_REV, [sorted(b) for b in (TECH, SOFT, BUSINESS, EDU, CERTS, CONDITIONS)])).encode("utf-8")
+).hexdigest()[:12]
+
+CATEGORIES = {
+    "tech": TECH, "soft": SOFT, "business": BUSINESS,
+    "education": EDU, "certs": CERTS, "conditions": CONDITIONS,
+}
+_BANK_PHRASES = sorted(set(ALL))
 
 REQ_MARKERS = {"must", "required", "mandatory", "need to", "have to"}
 NICE_MARKERS = {"nice to have", "bonus", "plus", "preferred"}
@@ -33,9 +51,6 @@ NICE_MARKERS = {"nice to have", "bonus", "plus", "preferred"}
 def _norm(s: str) -> str:
     return (s or "").lower()
 
-def _tokens(s: str) -> List[str]:
-    return [m.group(0).lower() for m in TOKEN_RE.finditer(_norm(s))]
-
 def _dedupe_keep_order(xs: List[str]) -> List[str]:
     seen = set()
     out = []
@@ -54,6 +69,102 @@ def fuzzy_find_present(text: str, bank: Set[str], threshold: int = 85) -> Set[st
             present.add(phrase)
     return present
 
+def extract_keywords(text: str) -> List[str]:
+    """Bank phrases found in free text, sorted (used by the mock AI provider)."""
+    return sorted(fuzzy_find_present(text, set(ALL)))
+
+# --- CV matching by segment ----------------------------------------------------
+# Incremental scoring matches the CV window by window. Window i is line i plus
+# enough of the following text to hold the longest bank phrase. At any side
+# that isn't the real start or end of the CV, the window is padded with a
+# filler character that matches nothing. partial_ratio then sees exactly the
+# alignments it would see in the whole text, so the union of window hits
+# equals matching the whole CV. Hits are a pure function of the window text,
+# which is what lets edits reuse every window they didn't touch.
+_SEGMENT_CACHE_SIZE = 20000
+_segment_cache: "OrderedDict[str, FrozenSet[str]]" = OrderedDict()
+_segment_lock = threading.Lock()
+
+_MAX_PHRASE = max(map(len, _BANK_PHRASES))
+_PAD = "\x00" * (_MAX_PHRASE - 1)
+
+def _match_text(text: str, threshold: int = 85, choices: Sequence[str] = _BANK_PHRASES) -> FrozenSet[str]:
+    """Bank phrases fuzzily present in already-normalized text (same test as fuzzy_find_present)."""
+    found = process.extract(text, choices, scorer=fuzz.partial_ratio,
+                            score_cutoff=threshold, limit=None)
+    return frozenset(phrase for phrase, _, _ in found)
+
+def _cv_windows(cv_text: str) -> List[str]:
+    text = _norm(cv_text)
+    ctx = _MAX_PHRASE - 1
+    windows: List[str] = []
+    start = 0
+    while start < len(text):
+        nl = text.find("\n", start)
+        end = len(text) if nl < 0 else nl + 1
+        stop = min(len(text), end + ctx)
+        windows.append(
+            ("" if start == 0 else _PAD) + text[start:stop] + ("" if stop == len(text) else _PAD)
+        )
+        start = end
+    return windows
+
+def _window_key(window: str) -> str:
+    return hashlib.blake2b(window.encode("utf-8"), digest_size=16).hexdigest()
+
+def _incremental_hits(cv_text: str) -> FrozenSet[str]:
+    windows = _cv_windows(cv_text)
+    keys = [_window_key(w) for w in windows]
+    with _segment_lock:
+        cached = [_segment_cache.get(key) for key in keys]
+        for key, hits in zip(keys, cached):
+            if hits is not None:
+                _segment_cache.move_to_end(key)
+    missing = [i for i, hits in enumerate(cached) if hits is None]
+    if not missing:
+        return frozenset().union(*cached)
+
+    if len(missing) * 2 > len(windows):
+        # mostly unseen (a first submission, or one another worker scored): one
+        # pass over the whole text is ~3x cheaper than one per window. The
+        # windows are still filled for the next edit, but matched only against
+        # what the whole text holds, since a window can't hold anything more.
+        found = _match_text(_norm(cv_text))
+        fresh_sets: Dict[int, Set[str]] = {i: set() for i in missing}
+        cold = [windows[i] for i in missing]
+        # one call per phrase found rather than one per window; partial_ratio
+        # aligns the shorter string inside the longer, so the order doesn't matter
+        for phrase in found:
+            for _, _, j in process.extract(phrase, cold, scorer=fuzz.partial_ratio,
+                                           score_cutoff=85, limit=None):
+                fresh_sets[missing[j]].add(phrase)
+        fresh = {i: frozenset(hits) for i, hits in fresh_sets.items()}
+    else:
+        found = None
+        fresh = {i: _match_text(windows[i]) for i in missing}
+    with _segment_lock:
+        for i, hits in fresh.items():
+            _segment_cache[keys[i]] = hits
+        while len(_segment_cache) > _SEGMENT_CACHE_SIZE:
+            _segment_cache.popitem(last=False)
+    if found is not None:
+        return found
+    return frozenset().union(*(fresh.get(i, hits) for i, hits in enumerate(cached)))
+
+def find_cv_present(cv_text: str, incremental: bool = False) -> Dict[str, Set[str]]:
+    """Bank phrases found in the CV, per category.
+
+    With ``incremental`` the per-window hits come from a process-wide cache keyed
+    by window content, so re-scoring an edited CV only matches changed windows;
+    a CV whose windows are mostly uncached is matched whole instead.
+    The result is identical either way.
+    """
+    if incremental:
+        hits: Set[str] = set(_incremental_hits(cv_text))
+    else:
+        hits = set(_match_text(_norm(cv_text)))
+    return {cat: hits & bank for cat, bank in CATEGORIES.items()}
+
 def fuzzy_required_optional(jd: str) -> Dict[str, Set[str]]:
     """Detect skills as required vs optional using marker windows."""
     jd_low = _norm(jd)
@@ -77,26 +188,39 @@ def fuzzy_required_optional(jd: str) -> Dict[str, Set[str]]:
             optional |= found
     return {"required": required, "optional": optional}
 
-def top_keywords(text: str, k: int = 25) -> List[Tuple[str,int]]:
-    toks = _tokens(text)
-    stop = {"the","and","a","to","of","in","for","on","with","as","by","is","are","was","were","be","an","at","or","from"}
-    toks = [x for x in toks if x not in stop and len(x) >= 2]
-    freq = Counter(toks)
-    return freq.most_common(k)
-
-def ats_score(cv_text: str, jd_text: str) -> Dict:
-    cv_present = {
-        "tech": fuzzy_find_present(cv_text, TECH),
-        "soft": fuzzy_find_present(cv_text, SOFT),
-        "business": fuzzy_find_present(cv_text, BUSINESS),
-        "education": fuzzy_find_present(cv_text, EDU),
-        "certs": fuzzy_find_present(cv_text, CERTS),
-        "conditions": fuzzy_find_present(cv_text, CONDITIONS),
-    }
+def top_keywords(text: str, k: int = 25) -> List[Tuple[str, float]]:
+    """Words and phrases of text ranked by TF-IDF against the analyzed corpus."""
+    return corpus.top(text, k)
 
+def prepare_jd(jd_text: str) -> Dict:
+    """Everything ats_score needs from the JD; compute once when scoring many CVs against it."""
     jd_req_opt = fuzzy_required_optional(jd_text)
-    req = jd_req_opt["required"]
-    opt = jd_req_opt["optional"]
+    return {
+        "required": jd_req_opt["required"],
+        "optional": jd_req_opt["optional"],
+        "top_keywords": top_keywords(jd_text, 20),
+    }
+
+@lru_cache(maxsize=256)
+def _jd_skills_cached(jd_text: str) -> Dict[str, Set[str]]:
+    return fuzzy_required_optional(jd_text)
+
+def prepare_jd_cached(jd_text: str) -> Dict:
+    """prepare_jd with the skill detection memoized on the JD text.
+
+    top_keywords is ranked on every call, because it depends on the corpus
+    statistics, which keep changing. Callers must treat the sets as read-only.
+    """
+    return {**_jd_skills_cached(jd_text), "top_keywords": top_keywords(jd_text, 20)}
+
+def ats_score(cv_text: str, jd_text: str, jd: Optional[Dict] = None, incremental: bool = False) -> Dict:
+    if jd is None:
+        jd = prepare_jd_cached(jd_text) if incremental else prepare_jd(jd_text)
+
+    cv_present = find_cv_present(cv_text, incremental=incremental)
+
+    req = jd["required"]
+    opt = jd["optional"]
 
     # coverage: required weighted more
     req_hit = len(req & set().union(*cv_present.values()))
@@ -137,6 +261,6 @@ def ats_score(cv_text: str, jd_text: str) -> Dict:
         "gaps_required": hard_gaps,
         "top_keywords": {
             "cv": top_keywords(cv_text, 20),
-            "jd": top_keywords(jd_text, 20),
+            "jd": list(jd["top_keywords"]),
         },
     }
@@ -0,0 +1,121 @@
+# backend/services/breaker.py
+import threading
+import time
+from typing import Dict, List, Tuple
+
+from core.config import settings
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for one upstream (provider + model).
+
+    A call counts as bad if it raises or takes longer than ``slow_call_s``.
+    ``failure_threshold`` bad calls in a row open the circuit. After
+    ``reset_timeout_s`` one probe call is let through (half-open): success
+    closes the circuit, another bad call re-opens it. A probe that ends without
+    a verdict (cancelled) must call ``release()``; one still in flight after
+    ``reset_timeout_s`` is presumed lost and another probe is allowed.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 5, slow_call_s: float = 8.0, reset_timeout_s: float = 30.0):
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.slow_call_s = slow_call_s
+        self.reset_timeout_s = reset_timeout_s
+
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._consecutive_bad = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._probe_started = 0.0
+        self._stats = {"calls": 0, "failures": 0, "slow_calls": 0, "short_circuited": 0, "opened": 0}
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._state == OPEN and time.monotonic() - self._opened_at >= self.reset_timeout_s:
+                self._state = HALF_OPEN
+                self._probe_in_flight = False
+            if self._state == CLOSED:
+                return True
+            now = time.monotonic()
+            if self._state == HALF_OPEN and (
+                not self._probe_in_flight or now - self._probe_started >= self.reset_timeout_s
+            ):
+                self._probe_in_flight = True
+                self._probe_started = now
+                return True
+            self._stats["short_circuited"] += 1
+            return False
+
+    def record_success(self, duration_s: float) -> None:
+        if duration_s > self.slow_call_s:
+            self._record_bad(slow=True)
+            return
+        with self._lock:
+            self._stats["calls"] += 1
+            self._consecutive_bad = 0
+            self._state = CLOSED
+            self._probe_in_flight = False
+
+    def release(self) -> None:
+        """End an allowed call that produced no verdict, e.g. it was cancelled."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        self._record_bad(slow=False)
+
+    def _record_bad(self, slow: bool) -> None:
+        with self._lock:
+            self._stats["calls"] += 1
+            self._stats["slow_calls" if slow else "failures"] += 1
+            self._consecutive_bad += 1
+            if self._state == HALF_OPEN or self._consecutive_bad >= self.failure_threshold:
+                if self._state != OPEN:
+                    self._stats["opened"] += 1
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+                self._probe_in_flight = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            retry_in = None
+            if self._state == OPEN:
+                retry_in = round(max(0.0, self.reset_timeout_s - (time.monotonic() - self._opened_at)), 1)
+            return {
+                "name": self.name,
+                "state": self._state,
+                "consecutive_bad": self._consecutive_bad,
+                "failure_threshold": self.failure_threshold,
+                "slow_call_ms": int(self.slow_call_s * 1000),
+                "retry_in_s": retry_in,
+                **self._stats,
+            }
+
+_breakers: Dict[Tuple[str, str], CircuitBreaker] = {}
+_registry_lock = threading.Lock()
+
+def get_breaker(provider: str, model: str) -> CircuitBreaker:
+    key = (provider, model)
+    with _registry_lock:
+        br = _breakers.get(key)
+        if br is None:
+            br = _breakers[key] = CircuitBreaker(
+                f"{provider}:{model}",
+                failure_threshold=settings.AI_BREAKER_FAILURES,
+                slow_call_s=settings.AI_SLOW_CALL_MS / 1000.0,
+                reset_timeout_s=settings.AI_BREAKER_RESET_S,
+            )
+        return br
+
+def breaker_states() -> List[dict]:
+    with _registry_lock:
+        breakers = list(_breakers.values())
+    return [b.snapshot() for b in breakers]
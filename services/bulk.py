@@ -0,0 +1,100 @@
+# backend/services/bulk.py
+import multiprocessing
+import os
+import shutil
+import tempfile
+import threading
+import zipfile
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from core.config import settings
+from core.limits import format_bytes
+from services import parser
+from services.ats import ats_score
+
+class Member(NamedTuple):
+    index: int
+    name: str
+    load: Optional[Callable[[], bytes]]  # None when the member was rejected up front
+    error: Optional[str] = None
+
+def spool_copy(fileobj, max_memory: int = 1024 * 1024):
+    """Copy an upload into a temp file we own (FastAPI closes uploads before a streamed body runs)."""
+    spool = tempfile.SpooledTemporaryFile(max_size=max_memory)
+    fileobj.seek(0)
+    shutil.copyfileobj(fileobj, spool, 64 * 1024)
+    spool.seek(0)
+    return spool
+
+def _check_name(name: str) -> Optional[str]:
+    ext = os.path.splitext(name.lower())[1]
+    if ext not in parser.SUPPORTED_EXTENSIONS:
+        return f"Unsupported file type '{ext or name}'"
+    return None
+
+def zip_members(spool, start: int = 0) -> List[Member]:
+    """List CVs inside a ZIP; raises ValueError if it isn't one."""
+    try:
+        zf = zipfile.ZipFile(spool)
+    except zipfile.BadZipFile:
+        raise ValueError("archive is not a valid ZIP file")
+
+    members: List[Member] = []
+    for info in zf.infolist():
+        base = os.path.basename(info.filename)
+        if info.is_dir() or not base or base.startswith(".") or info.filename.startswith("__MACOSX/"):
+            continue
+        index = start + len(members)
+        error = _check_name(base)
+        if not error and info.file_size > settings.BULK_MAX_FILE_BYTES:
+            error = f"File too large (max {format_bytes(settings.BULK_MAX_FILE_BYTES)})"
+        load = None if error else (lambda info=info: zf.read(info))
+        members.append(Member(index, info.filename, load, error))
+    return members
+
+def spool_member(index: int, name: str, spool) -> Member:
+    error = _check_name(name)
+    if error:
+        return Member(index, name, None, error)
+
+    def load() -> bytes:
+        spool.seek(0)
+        content = spool.read(settings.BULK_MAX_FILE_BYTES + 1)
+        if len(content) > settings.BULK_MAX_FILE_BYTES:
+            raise ValueError(f"File too large (max {format_bytes(settings.BULK_MAX_FILE_BYTES)})")
+        return content
+
+    return Member(index, name, load)
+
+def parse_and_score(name: str, content: bytes, job_description: str, jd: Dict) -> Dict:
+    """CPU part of one bulk item; module-level so it can run in a worker process."""
+    text = parser.extract_text_bytes(content, filename=name)
+    if not text.strip():
+        return {"text": "", "ats": None}
+    return {"text": text, "ats": ats_score(text, job_description, jd=jd)}
+
+# --- process pool -------------------------------------------------------------
+_pool: Optional[Executor] = None
+_pool_lock = threading.Lock()
+
+def get_pool() -> Optional[Executor]:
+    """Shared parse/score pool for this API worker, or None to use the thread pool."""
+    global _pool
+    if settings.BULK_WORKERS <= 0:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            # spawn, not fork: the API process already runs threads (write-behind, anyio)
+            _pool = ProcessPoolExecutor(
+                max_workers=settings.BULK_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+    return _pool
+
+def shutdown_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
@@ -0,0 +1,261 @@
+# backend/services/keywords.py
+"""Keyword extraction ranked by TF-IDF over every CV and JD this API has analyzed.
+
+Terms are single words plus phrases of up to KEYWORD_MAX_NGRAM words that are
+adjacent in the text. A phrase never crosses punctuation or a line break.
+Document frequencies are held in memory as a term -> id dict and an ``array``
+of counts. Increments are written to ``keyword_stats`` in batches, so a
+restarted worker can load them back.
+"""
+import hashlib
+import math
+import re
+import threading
+from array import array
+from collections import Counter, OrderedDict
+from itertools import chain, islice
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from db.models import KeywordStat
+from db.session import SessionLocal
+from db.write_behind import WriteBehindBuffer
+
+DOCS_TERM = "<docs>"  # can't collide with a real term: "<" never matches WORD_RE
+
+# keeps the punctuation skills are spelled with: c++, c#, .net, ci/cd, scikit-learn, node.js
+WORD_RE = re.compile(r"(?<![\w.])\.?[a-z0-9][a-z0-9+#]*(?:[./\-][a-z0-9+#]+)*")
+
+STOPWORDS = frozenset("""
+a about above after again against all also am an and any are as at be because been before being
+below between both but by can could did do does doing down during each etc few for from further
+had has have having he her here hers him his how i if in into is it its itself just me more most
+my no nor not of off on once only or other our ours out over own per same she should so some
+such than that the their theirs them then there these they this those through to too under
+until up us very via was we were what when where which while who whom why will with within
+without would you your yours
+""".split()) | frozenset("""
+ability able benefits bonus candidate comfortable experience familiarity good great ideally including
+knowledge looking mandatory must need needed needs nice plus preferred preferably required
+requirements requirement responsibilities role strong team understanding years
+""".split())  # JD boilerplate: says how much a skill matters, never what it is
+
+# the only stopwords allowed inside a phrase: "attention to detail", "bachelor of science"
+PHRASE_JOINERS = frozenset({"of", "to", "on"})
+
+_SEEN_MAX = 20000  # recently observed document digests, so re-submissions don't inflate df
+
+def _runs(text: str) -> List[List[str]]:
+    """Words of text grouped into runs separated only by spaces/tabs."""
+    low = (text or "").lower()
+    runs: List[List[str]] = []
+    run: List[str] = []
+    end = 0
+    for m in WORD_RE.finditer(low):
+        gap = low[end:m.start()]
+        if run and (not gap.isspace() or "\n" in gap):
+            runs.append(run)
+            run = []
+        run.append(m.group(0))
+        end = m.end()
+    if run:
+        runs.append(run)
+    return runs
+
+def _is_keyword(tok: str) -> bool:
+    return tok not in STOPWORDS and any(c.isalpha() for c in tok)
+
+def terms(text: str, max_n: Optional[int] = None) -> List[str]:
+    """Every term occurrence in text: keyword unigrams, then phrases of 2..max_n words.
+
+    Phrases start and end on a keyword; inside, only PHRASE_JOINERS may stand in for one.
+    """
+    max_n = settings.KEYWORD_MAX_NGRAM if max_n is None else max_n
+    out: List[str] = []
+    for run in _runs(text):
+        ok = [_is_keyword(t) for t in run]
+        inner = [good or t in PHRASE_JOINERS for t, good in zip(run, ok)]
+        out.extend(t for t, good in zip(run, ok) if good)
+        for n in range(2, max_n + 1):
+            out.extend(
+                " ".join(run[i:i + n])
+                for i in range(len(run) - n + 1)
+                if ok[i] and ok[i + n - 1] and all(inner[i + 1:i + n - 1])
+            )
+    return out
+
+class CorpusStats:
+    """Document frequencies for the corpus of analyzed texts; thread-safe.
+
+    Each document counts once per distinct term it contains. Identical texts
+    seen again are ignored. When the vocabulary reaches ``max_terms``, only the
+    most frequent half is kept. That is min-df pruning: one-off phrases make
+    room, and a dropped term ranks as if it were new.
+    """
+
+    def __init__(self, max_terms: int, buffer: Optional[WriteBehindBuffer] = None):
+        self.max_terms = max(1, int(max_terms))
+        self.buffer = buffer
+        self.n_docs = 0
+        self._ids: Dict[str, int] = {}
+        self._df = array("I")
+        self._seen: "OrderedDict[bytes, None]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def observe(self, text: str) -> int:
+        return self.observe_many([text])
+
+    def observe_many(self, texts: Iterable[str]) -> int:
+        """Add documents to the statistics; returns how many were new."""
+        # tokenize outside the lock; only the counting below is serialized
+        docs = [
+            (hashlib.blake2b(t.encode("utf-8"), digest_size=16).digest(), set(terms(t)))
+            for t in texts if t and t.strip()
+        ]
+        with self._lock:
+            fresh = []
+            for key, doc_terms in docs:
+                if key in self._seen:
+                    self._seen.move_to_end(key)
+                    continue
+                self._seen[key] = None
+                if len(self._seen) > _SEEN_MAX:
+                    self._seen.popitem(last=False)
+                fresh.append(doc_terms)
+            if not fresh:
+                return 0
+
+            new = {t for doc_terms in fresh for t in doc_terms if t not in self._ids}
+            if len(self._ids) + len(new) > self.max_terms:
+                self._compact()
+            ids, df = self._ids, self._df
+            for t in islice(new, max(0, self.max_terms - len(ids))):
+                ids[t] = len(ids)
+            df.extend([0] * (len(ids) - len(df)))
+            # one C-level count over the whole batch, then one add per distinct term
+            counts = Counter(map(ids.get, chain.from_iterable(fresh)))
+            counts.pop(None, None)
+            for i, c in counts.items():
+                df[i] += c
+            self.n_docs += len(fresh)
+            tracked = [tuple(t for t in doc_terms if t in ids) for doc_terms in fresh]
+
+        if self.buffer is not None:
+            for doc_terms in tracked:
+                self.buffer.enqueue({"terms": doc_terms})
+        return len(fresh)
+
+    def _compact(self) -> None:
+        """Keep the max_terms // 2 most frequent terms; caller holds the lock."""
+        keep = self.max_terms // 2
+        if len(self._ids) <= keep:
+            return
+        df = self._df
+        kept = sorted(self._ids.items(), key=lambda item: df[item[1]], reverse=True)[:keep]
+        self._ids = {term: new_id for new_id, (term, _) in enumerate(kept)}
+        self._df = array("I", (df[old_id] for _, old_id in kept))
+
+    def df(self, term: str) -> int:
+        i = self._ids.get(term)
+        return self._df[i] if i is not None else 0
+
+    def top(self, text: str, k: int = 20) -> List[Tuple[str, float]]:
+        """The k terms of text with the highest TF-IDF, as (term, score) pairs.
+
+        A phrase only ranks once it has been seen in KEYWORD_PHRASE_MIN_DF
+        documents; until then it is more likely a chance adjacency than a term.
+        A word or shorter phrase that only ever occurs inside a ranked phrase
+        (same tf, same df) is left out in favour of that phrase.
+        """
+        tf = Counter(terms(text))
+        if not tf:
+            return []
+        with self._lock:
+            n = self.n_docs
+            df = self._df
+            dfs = [df[i] if i is not None else 0 for i in map(self._ids.get, tf)]
+        min_df = settings.KEYWORD_PHRASE_MIN_DF
+        scored = [
+            # sublinear tf and smoothed idf, so an empty corpus ranks by frequency alone
+            (term, round((1.0 + math.log(count)) * (math.log((1 + n) / (1 + d)) + 1.0), 3), count, d)
+            for (term, count), d in zip(tf.items(), dfs)
+            if d >= min_df or " " not in term
+        ]
+        # on a tie, longer phrases first, so they are picked before the words they contain
+        scored.sort(key=lambda x: (-x[1], -x[0].count(" "), x[0]))
+        out: List[Tuple[str, float]] = []
+        picked: List[Tuple[str, int, int]] = []
+        for term, score, count, d in scored:
+            inner = f" {term} "
+            if any(c == count and pd == d and inner in f" {p} " for p, c, pd in picked):
+                continue
+            out.append((term, score))
+            if " " in term:
+                picked.append((term, count, d))
+            if len(out) == k:
+                break
+        return out
+
+    def load(self, session_factory: Callable[[], Session] = SessionLocal) -> int:
+        """Replace the in-memory counts with the stored ones; returns the number of terms loaded.
+
+        The most frequent terms win when there are more than ``max_terms``.
+        """
+        if self.buffer is not None:
+            self.buffer.flush()
+        db = session_factory()
+        try:
+            docs = db.get(KeywordStat, DOCS_TERM)
+            rows = db.execute(
+                select(KeywordStat.term, KeywordStat.df)
+                .where(KeywordStat.term != DOCS_TERM)
+                .order_by(KeywordStat.df.desc())
+                .limit(self.max_terms)
+            ).all()
+        finally:
+            db.close()
+        ids: Dict[str, int] = {}
+        df = array("I")
+        for term, count in rows:
+            ids[term] = len(df)
+            df.append(count)
+        with self._lock:
+            self._ids, self._df = ids, df
+            self.n_docs = docs.df if docs else 0
+        return len(ids)
+
+class KeywordStatsBuffer(WriteBehindBuffer):
+    """Queues one row per observed document; a flush adds their term counts to keyword_stats."""
+
+    _dialects = {"postgresql": postgresql, "sqlite": sqlite}
+
+    def _write(self, db: Session, rows: List[Dict]) -> None:
+        dialect = self._dialects.get(db.get_bind().dialect.name)
+        if dialect is None:
+            raise RuntimeError(f"keyword stats need PostgreSQL or SQLite, not {db.get_bind().dialect.name}")
+        delta = Counter(chain.from_iterable(r["terms"] for r in rows))
+        delta[DOCS_TERM] += len(rows)
+        stmt = dialect.insert(KeywordStat)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[KeywordStat.term],
+            set_={"df": KeywordStat.df + stmt.excluded.df},
+        )
+        # sorted, so concurrent flushes from several workers lock rows in the same order
+        values = [{"term": t, "df": c} for t, c in sorted(delta.items())]
+        for i in range(0, len(values), 1000):
+            db.execute(stmt, values[i:i + 1000])
+
+# One set of statistics per worker process; loaded and flushed from app lifecycle events.
+keyword_buffer = KeywordStatsBuffer(
+    KeywordStat,
+    flush_ms=settings.KEYWORD_FLUSH_MS,
+    max_rows=settings.KEYWORD_FLUSH_DOCS,
+)
+corpus = CorpusStats(settings.KEYWORD_VOCAB_MAX, buffer=keyword_buffer)
@@ -1,8 +1,13 @@
+import io
+import mmap
 import os
-from typing import Optional
+from contextlib import contextmanager
+from typing import BinaryIO, Optional
 import pdfplumber
 from docx import Document
 
+SUPPORTED_EXTENSIONS = {".pdf", ".docx", ".txt"}
+
 def extract_text(path: str) -> Optional[str]:
     _, ext = os.path.splitext(path.lower())
     try:
@@ -14,13 +19,65 @@ def extract_text(path: str) -> Optional[str]:
         return None
     return None
 
-def _pdf_text(path: str) -> str:
+def extract_text_bytes(content: bytes, filename: str = "") -> str:
+    """Text of an in-memory upload; empty string when the format is unknown or unreadable."""
+    _, ext = os.path.splitext((filename or "").lower())
+    try:
+        if ext == ".pdf":
+            return _pdf_text(io.BytesIO(content))
+        elif ext == ".docx":
+            return _docx_text(io.BytesIO(content))
+        elif ext == ".txt":
+            return content.decode("utf-8", errors="replace")
+    except Exception:
+        return ""
+    return ""
+
+def extract_text_file(fileobj: BinaryIO, filename: str = "", max_text_bytes: int = 10 * 1024 * 1024) -> str:
+    """Text of an upload read straight from its (spooled) file object.
+
+    PDFs spilled to disk are parsed through a read-only memory map and DOCX is
+    read member by member from the file, so neither is copied into a bytes
+    object first. Returns "" like extract_text_bytes.
+    """
+    _, ext = os.path.splitext((filename or "").lower())
+    try:
+        fileobj.seek(0)
+        if ext == ".pdf":
+            with _mapped(fileobj) as src:
+                return _pdf_text(src)
+        elif ext == ".docx":
+            return _docx_text(fileobj)
+        elif ext == ".txt":
+            return fileobj.read(max_text_bytes).decode("utf-8", errors="replace")
+    except Exception:
+        return ""
+    return ""
+
+@contextmanager
+def _mapped(fileobj: BinaryIO):
+    """mmap of a SpooledTemporaryFile that rolled over to disk; the file itself otherwise."""
+    # fileno() would force an in-memory spool to disk, so only map rolled ones
+    if not getattr(fileobj, "_rolled", False):
+        yield fileobj
+        return
+    try:
+        mm = mmap.mmap(fileobj.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):  # empty file or not mappable
+        yield fileobj
+        return
+    try:
+        yield mm
+    finally:
+        mm.close()
+
+def _pdf_text(src) -> str:
     chunks = []
-    with pdfplumber.open(path) as pdf:
+    with pdfplumber.open(src) as pdf:
         for page in pdf.pages:
             chunks.append(page.extract_text() or "")
     return "\n".join(chunks)
 
-def _docx_text(path: str) -> str:
-    doc = Document(path)
+def _docx_text(src) -> str:
+    doc = Document(src)
     return "\n".join(p.text for p in doc.paragraphs)
@@ -0,0 +1,86 @@
+# backend/services/pipeline.py
+import asyncio
+import inspect
+import time
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+class Stage(NamedTuple):
+    """One step of a Pipeline.
+
+    ``fn`` receives the context dict (the run inputs plus the result of every
+    finished stage, keyed by stage name). ``kind="cpu"`` runs it in the default
+    executor; ``kind="io"`` expects a coroutine function and awaits it on the
+    loop. ``when`` gates optional stages: if it returns False the stage is
+    skipped and its result is None.
+    """
+    name: str
+    fn: Callable[[Dict[str, Any]], Any]
+    deps: Tuple[str, ...] = ()
+    kind: str = "cpu"
+    when: Optional[Callable[[Dict[str, Any]], bool]] = None
+
+class PipelineResult(NamedTuple):
+    results: Dict[str, Any]
+    timings: Dict[str, float]  # ms per executed stage, plus "total"
+    skipped: List[str]
+
+    def server_timing(self) -> str:
+        """Value for the Server-Timing response header."""
+        return ", ".join(f"{name};dur={ms}" for name, ms in self.timings.items())
+
+class Pipeline:
+    """Small DAG runner: every stage starts as soon as its dependencies finish."""
+
+    def __init__(self, stages: Iterable[Stage]):
+        self.stages: Dict[str, Stage] = {}
+        for st in stages:
+            if st.name in self.stages:
+                raise ValueError(f"duplicate stage '{st.name}'")
+            if st.kind not in ("cpu", "io"):
+                raise ValueError(f"stage '{st.name}': kind must be 'cpu' or 'io'")
+            if st.kind == "io" and not inspect.iscoroutinefunction(st.fn):
+                raise ValueError(f"stage '{st.name}': io stages need a coroutine function")
+            missing = [d for d in st.deps if d not in self.stages]
+            if missing:
+                # declaring stages in dependency order also rules out cycles
+                raise ValueError(f"stage '{st.name}' depends on undeclared stage(s) {missing}")
+            self.stages[st.name] = st
+
+    async def run(self, inputs: Dict[str, Any]) -> PipelineResult:
+        loop = asyncio.get_running_loop()
+        ctx: Dict[str, Any] = dict(inputs)
+        timings: Dict[str, float] = {}
+        skipped: List[str] = []
+        tasks: Dict[str, asyncio.Task] = {}
+
+        async def run_stage(st: Stage) -> None:
+            if st.deps:
+                await asyncio.gather(*(tasks[d] for d in st.deps))
+            if st.when is not None and not st.when(ctx):
+                ctx[st.name] = None
+                skipped.append(st.name)
+                return
+            t0 = time.perf_counter()
+            if st.kind == "io":
+                ctx[st.name] = await st.fn(ctx)
+            else:
+                ctx[st.name] = await loop.run_in_executor(None, st.fn, ctx)
+            timings[st.name] = round((time.perf_counter() - t0) * 1000, 1)
+
+        started = time.perf_counter()
+        for name, st in self.stages.items():
+            tasks[name] = asyncio.create_task(run_stage(st), name=f"stage:{name}")
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            # one stage failed (or the request was cancelled): stop the rest
+            for t in tasks.values():
+                t.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+
+        # report in declaration order regardless of completion order
+        ordered = {n: timings[n] for n in self.stages if n in timings}
+        ordered["total"] = round((time.perf_counter() - started) * 1000, 1)
+        results = {n: ctx[n] for n in self.stages}
+        return PipelineResult(results, ordered, skipped)
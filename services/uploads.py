@@ -0,0 +1,30 @@
+# backend/services/uploads.py
+import hashlib
+import os
+from typing import BinaryIO
+
+from fastapi import HTTPException, UploadFile
+
+from core.limits import format_bytes
+
+CHUNK_SIZE = 64 * 1024
+
+def ensure_size(file: UploadFile, max_bytes: int) -> int:
+    """Size of an upload in bytes; 413 if it is over ``max_bytes``."""
+    size = file.size
+    if size is None:
+        file.file.seek(0, os.SEEK_END)
+        size = file.file.tell()
+    file.file.seek(0)
+    if size > max_bytes:
+        raise HTTPException(413, f"File too large (max {format_bytes(max_bytes)})")
+    return size
+
+def file_sha256(fileobj: BinaryIO) -> str:
+    """Hash an upload in chunks, leaving it rewound for the parser."""
+    h = hashlib.sha256()
+    fileobj.seek(0)
+    for chunk in iter(lambda: fileobj.read(CHUNK_SIZE), b""):
+        h.update(chunk)
+    fileobj.seek(0)
+    return h.hexdigest()
@@ -0,0 +1,158 @@
+# backend/services/warmup.py
+"""Warm-up checks run before a worker takes traffic; their results back /ready.
+
+Under gunicorn with preload_app, the checks in PREFORK_CHECKS run once in the
+master (gunicorn.conf.py). Workers inherit the loaded modules, caches and
+keyword statistics copy-on-write, and each forked worker skips the checks that
+already passed. The database check always runs per process, because pooled
+connections can't cross a fork.
+"""
+import io
+import threading
+import time
+from concurrent.futures import wait
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import text
+
+from core.config import settings
+from db.session import engine
+
+SAMPLE_CV = """Jane Doe - Backend Engineer
+Experience
+- Built FastAPI services in Python with PostgreSQL and Redis on AWS.
+- Led Docker and Kubernetes migration; mentoring and stakeholder management.
+Education
+MSc Computer Science"""
+
+SAMPLE_JD = """Backend Engineer
+Must have Python, SQL and Docker. Kubernetes required.
+Nice to have: Terraform, AWS certified. Remote, full-time."""
+
+# hand-written one-page PDF; pdfminer rebuilds the missing xref table itself
+SAMPLE_PDF = (
+    b"%PDF-1.4\n"
+    b"1 0 obj <</Type /Catalog /Pages 2 0 R>> endobj\n"
+    b"2 0 obj <</Type /Pages /Kids [3 0 R] /Count 1>> endobj\n"
+    b"3 0 obj <</Type /Page /Parent 2 0 R /MediaBox [0 0 300 80] "
+    b"/Resources <</Font <</F1 4 0 R>>>> /Contents 5 0 R>> endobj\n"
+    b"4 0 obj <</Type /Font /Subtype /Type1 /BaseFont /Helvetica>> endobj\n"
+    b"5 0 obj <</Length 47>> stream\n"
+    b"BT /F1 12 Tf 10 40 Td (Python SQL Docker) Tj ET\n"
+    b"endstream endobj\n"
+    b"trailer <</Root 1 0 R>>\n%%EOF\n"
+)
+
+def _database() -> str:
+    # hold several connections at once so the pool really opens that many
+    conns = [engine.connect() for _ in range(max(1, settings.WARMUP_DB_CONNECTIONS))]
+    try:
+        for conn in conns:
+            conn.execute(text("SELECT 1"))
+    finally:
+        for conn in conns:
+            conn.close()
+    return f"{len(conns)} connection(s) open"
+
+def _parsers() -> str:
+    from docx import Document
+    from services import parser
+
+    doc = Document()
+    for line in SAMPLE_CV.splitlines():
+        doc.add_paragraph(line)
+    buf = io.BytesIO()
+    doc.save(buf)
+    for name, content in (("warmup.pdf", SAMPLE_PDF), ("warmup.docx", buf.getvalue())):
+        if "python" not in parser.extract_text_bytes(content, name).lower():
+            raise RuntimeError(f"{name}: sample text not extracted")
+    return "pdf, docx"
+
+def _matchers() -> str:
+    from services.ats import find_cv_present, prepare_jd_cached
+
+    jd = prepare_jd_cached(SAMPLE_JD)
+    if not jd["required"]:
+        raise RuntimeError("no required skills found in the sample JD")
+    find_cv_present(SAMPLE_CV, incremental=True)
+    return f"{len(jd['required'])} required skill(s) in sample JD"
+
+def _ats() -> str:
+    from services.ats import ats_score
+
+    result = ats_score(SAMPLE_CV, SAMPLE_JD, incremental=True)
+    if result["score_overall"] <= 0:
+        raise RuntimeError("sample CV scored 0")
+    return f"score {result['score_overall']}"
+
+def _keywords() -> str:
+    from services.keywords import corpus
+
+    corpus.load()
+    return f"{len(corpus)} terms over {corpus.n_docs} documents"
+
+def _bulk_pool() -> str:
+    from services import bulk
+
+    pool = bulk.get_pool()
+    if pool is None:
+        return "disabled (BULK_WORKERS=0)"
+    # ProcessPoolExecutor spawns lazily; one job per worker brings them all up
+    jobs = [pool.submit(bulk.parse_and_score, "warmup.txt", SAMPLE_CV.encode("utf-8"), SAMPLE_JD, None)
+            for _ in range(settings.BULK_WORKERS)]
+    done, _ = wait(jobs, timeout=60)
+    if len(done) < len(jobs):
+        raise RuntimeError("bulk workers did not start within 60s")
+    for job in done:
+        job.result()
+    return f"{settings.BULK_WORKERS} process(es)"
+
+CHECKS: Dict[str, Callable[[], str]] = {
+    "database": _database,
+    "parsers": _parsers,
+    "matchers": _matchers,
+    "ats": _ats,
+    "keywords": _keywords,
+    "bulk_pool": _bulk_pool,
+}
+PREFORK_CHECKS = ("parsers", "matchers", "ats", "keywords")
+LIVE_CHECKS = ("database",)  # re-run on every /ready call
+
+results: Dict[str, Dict] = {}
+_lock = threading.Lock()
+
+def enabled_checks() -> Tuple[str, ...]:
+    names = tuple(CHECKS)
+    if not settings.WARMUP_BULK_POOL:
+        names = tuple(n for n in names if n != "bulk_pool")
+    return names
+
+def _run_one(name: str) -> Dict:
+    t0 = time.perf_counter()
+    try:
+        detail, ok, error = CHECKS[name](), True, None
+    except Exception as e:
+        detail, ok, error = None, False, str(e) or e.__class__.__name__
+    res = {"ok": ok, "ms": round((time.perf_counter() - t0) * 1000, 1)}
+    if detail:
+        res["detail"] = detail
+    if error:
+        res["error"] = error
+    return res
+
+def run(names: Optional[Iterable[str]] = None, force: bool = False) -> Dict[str, Dict]:
+    """Run the given checks (default: all enabled ones), skipping those that already passed.
+
+    ``force`` re-runs passed checks too. Never raises; failures are recorded.
+    """
+    with _lock:
+        for name in names or enabled_checks():
+            if force or name in LIVE_CHECKS or not results.get(name, {}).get("ok"):
+                results[name] = _run_one(name)
+        return dict(results)
+
+def readiness() -> Tuple[bool, Dict[str, Dict]]:
+    """Re-run live and failed checks; ready when every enabled check passes."""
+    names = enabled_checks()
+    checks = run(names)
+    return all(checks.get(n, {}).get("ok") for n in names), {n: checks[n] for n in names}